@@ -39,6 +39,15 @@ class Settings(BaseSettings):
     database_pool_timeout: int = Field(
         default=60, ge=1, le=300, description="Database pool timeout in seconds"
     )
+    database_write_concurrency: int = Field(
+        default=8,
+        ge=1,
+        le=99,
+        description="Batch-write chunks run at once; must leave a pooled connection free",
+    )
+    database_socket_timeout: int = Field(
+        default=30, ge=1, le=300, description="Database socket timeout in seconds"
+    )
     database_echo: bool = Field(
         default=False, description="Echo SQL queries (for debugging)"
     )
@@ -52,6 +61,9 @@ class Settings(BaseSettings):
 
     # Enrichment API keys
     serper_api_key: Optional[str] = Field(default=None, description="Serper.dev API key for Google search")
+    serper_max_qps: float = Field(
+        default=5.0, gt=0, le=300, description="Maximum Serper.dev queries per second"
+    )
 
     # Email batching and rate limiting configuration
     email_batch_size: int = Field(
@@ -158,6 +170,12 @@ class Settings(BaseSettings):
             raise ValueError(
                 "database_pool_max must be greater than or equal to database_pool_min"
             )
+        # Concurrent batch-write chunks each hold a connection; keep one
+        # free so reads are not starved while a large batch is writing
+        if self.database_write_concurrency >= self.database_pool_max:
+            raise ValueError(
+                "database_write_concurrency must be less than database_pool_max"
+            )
         return self
 
     @property
@@ -166,6 +184,19 @@ class Settings(BaseSettings):
         password = f":{self.database_password}" if self.database_password else ""
         return f"postgresql://{self.database_user}{password}@{self.database_host}:{self.database_port}/{self.database_name}"
 
+    @property
+    def prisma_database_url(self) -> str:
+        """Database URL with Prisma connection pool parameters.
+
+        Prisma's default pool (num_cpus * 2 + 1) is too small for the
+        concurrent ingest/enrichment batches, so size it from settings.
+        """
+        return (
+            f"{self.database_url}?connection_limit={self.database_pool_max}"
+            f"&pool_timeout={self.database_pool_timeout}"
+            f"&socket_timeout={self.database_socket_timeout}"
+        )
+
     @property
     def async_database_url(self) -> str:
         """Async database URL for SQLModel/SQLAlchemy async connections"""
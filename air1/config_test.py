@@ -52,6 +52,20 @@ class TestSettings:
             Settings()
         assert "greater than or equal to 1" in str(exc_info.value)
 
+    def test_write_concurrency_must_leave_a_free_connection(self, monkeypatch):
+        """Test write concurrency is validated against the pool size."""
+        monkeypatch.setenv("DATABASE_USER", "testuser")
+        monkeypatch.setenv("DATABASE_POOL_MIN", "4")
+        monkeypatch.setenv("DATABASE_POOL_MAX", "8")
+
+        monkeypatch.setenv("DATABASE_WRITE_CONCURRENCY", "8")
+        with pytest.raises(ValidationError) as exc_info:
+            Settings()
+        assert "database_write_concurrency" in str(exc_info.value)
+
+        monkeypatch.setenv("DATABASE_WRITE_CONCURRENCY", "7")
+        assert Settings().database_write_concurrency == 7
+
     def test_database_url_property(self, monkeypatch):
         """Test database URL generation."""
         monkeypatch.setenv("DATABASE_HOST", "dbhost")
@@ -75,6 +89,21 @@ class TestSettings:
         expected_url = "postgresql://dbuser@localhost:5432/air1"
         assert settings.database_url == expected_url
 
+    def test_prisma_database_url_includes_pool_params(self, monkeypatch):
+        """Test Prisma URL carries connection pool parameters."""
+        monkeypatch.setenv("DATABASE_USER", "dbuser")
+        monkeypatch.setenv("DATABASE_PASSWORD", "")
+        monkeypatch.setenv("DATABASE_POOL_MAX", "40")
+        monkeypatch.setenv("DATABASE_POOL_TIMEOUT", "10")
+
+        settings = Settings()
+
+        expected_url = (
+            "postgresql://dbuser@localhost:5432/air1"
+            "?connection_limit=40&pool_timeout=10&socket_timeout=30"
+        )
+        assert settings.prisma_database_url == expected_url
+
     def test_async_database_url_property(self, monkeypatch):
         """Test async database URL generation."""
         monkeypatch.setenv("DATABASE_HOST", "dbhost")
@@ -0,0 +1,26 @@
+-- Migration: Speed up the "software companies without websites" enrichment lookup
+--
+-- get_software_companies_without_websites runs once per enrichment batch. Without
+-- these, Postgres seq-scans sec_form_d and re-runs four ILIKE scans per row.
+
+-- Fold the four issuer-name exclusions into one precomputed flag
+ALTER TABLE sec_form_d ADD COLUMN IF NOT EXISTS issuer_name_is_fund BOOLEAN
+    GENERATED ALWAYS AS (
+        issuer_name ILIKE '%fund%'
+        OR issuer_name ILIKE '%investment%'
+        OR issuer_name ILIKE '%holdings%'
+        OR issuer_name ILIKE '%investor%'
+    ) STORED;
+
+-- Only companies still missing a website are candidates
+CREATE INDEX IF NOT EXISTS idx_sec_company_enrich
+    ON sec_company(cik)
+    WHERE website IS NULL OR website = '';
+
+-- Covering index so the Form D join is answered from the index alone
+CREATE INDEX IF NOT EXISTS idx_sec_form_d_enrich
+    ON sec_form_d(sec_filing_id)
+    INCLUDE (
+        issuer_name, issuer_city, issuer_state, industry_group_type,
+        is_pooled_investment, total_amount_sold, issuer_name_is_fund
+    );
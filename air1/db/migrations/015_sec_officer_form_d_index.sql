@@ -0,0 +1,7 @@
+-- Migration: Index sec_officer by its Form D
+--
+-- Every Form D save syncs its officers by sec_form_d_id. Without this index
+-- each sync seq-scans the whole sec_officer table.
+
+CREATE INDEX IF NOT EXISTS idx_sec_officer_form_d
+    ON sec_officer(sec_form_d_id);
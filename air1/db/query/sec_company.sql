@@ -22,12 +22,10 @@ JOIN sec_filing sf ON sf.cik = sc.cik
 JOIN sec_form_d sfd ON sfd.sec_filing_id = sf.sec_filing_id
 WHERE sfd.is_pooled_investment = false
   AND sfd.industry_group_type IN ('Other Technology', 'Computers')
-  AND sfd.issuer_name NOT ILIKE '%fund%'
-  AND sfd.issuer_name NOT ILIKE '%investment%'
-  AND sfd.issuer_name NOT ILIKE '%holdings%'
-  AND sfd.issuer_name NOT ILIKE '%investor%'
+  AND sfd.issuer_name_is_fund = false
   AND sfd.total_amount_sold > 0
   AND (sc.website IS NULL OR sc.website = '')
+  AND sc.cik > :after_cik
 ORDER BY sc.cik, sf.filing_date DESC
 LIMIT :limit;
 
@@ -51,14 +49,18 @@ WHERE cik = :cik;
 SELECT sec_company_id AS "secCompanyId", cik, name, ticker, exchange
 FROM sec_company
 WHERE enriched_at IS NULL
+  AND sec_company_id % :shards = :shard
 ORDER BY sec_company_id
 LIMIT :limit;
 
 -- name: count_sec_companies$
-SELECT COUNT(*) FROM sec_company;
+SELECT COUNT(*)::INT FROM sec_company;
+
+-- name: sec_companies_exist$
+SELECT EXISTS (SELECT 1 FROM sec_company);
 
 -- name: count_sec_companies_not_enriched$
-SELECT COUNT(*) FROM sec_company WHERE enriched_at IS NULL;
+SELECT COUNT(*)::INT FROM sec_company WHERE enriched_at IS NULL;
 
 -- name: upsert_sec_company_from_issuer^
 INSERT INTO sec_company (cik, name, street, city, state_or_country, zip_code, phone)
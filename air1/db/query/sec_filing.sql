@@ -21,11 +21,32 @@ FROM sec_filing sf
 LEFT JOIN sec_form_d sfd ON sfd.sec_filing_id = sf.sec_filing_id
 WHERE sf.form_type IN ('D', 'D/A')
   AND sfd.sec_form_d_id IS NULL
+  AND sf.sec_filing_id % :shards = :shard
 ORDER BY sf.filing_date DESC
 LIMIT :limit;
 
+-- name: get_form_d_filings_not_parsed_by_accession
+SELECT sf.sec_filing_id AS "secFilingId",
+       sf.accession_number AS "accessionNumber",
+       sf.cik,
+       sf.form_type AS "formType",
+       sf.filing_date AS "filingDate",
+       sf.company_name AS "companyName"
+FROM sec_filing sf
+LEFT JOIN sec_form_d sfd ON sfd.sec_filing_id = sf.sec_filing_id
+WHERE sf.accession_number = ANY(:accession_numbers::text[])
+  AND sf.form_type IN ('D', 'D/A')
+  AND sfd.sec_form_d_id IS NULL;
+
 -- name: link_orphaned_filings!
 UPDATE sec_filing sf SET
     sec_company_id = sc.sec_company_id
 FROM sec_company sc
 WHERE sf.cik = sc.cik AND sf.sec_company_id IS NULL;
+
+-- name: link_orphaned_filings_for_ciks!
+UPDATE sec_filing sf SET
+    sec_company_id = sc.sec_company_id
+FROM sec_company sc
+WHERE sf.cik = ANY(:ciks::text[])
+  AND sf.cik = sc.cik AND sf.sec_company_id IS NULL;
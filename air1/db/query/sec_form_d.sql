@@ -1,53 +1,3 @@
--- name: upsert_sec_form_d^
-INSERT INTO sec_form_d (
-    sec_filing_id, issuer_name, issuer_street, issuer_city,
-    issuer_state, issuer_zip, issuer_phone, entity_type,
-    industry_group_type, revenue_range, federal_exemptions,
-    total_offering_amount, total_amount_sold, total_remaining,
-    date_of_first_sale, minimum_investment, total_investors,
-    has_non_accredited_investors, is_equity, is_pooled_investment,
-    is_new_offering, more_than_one_year, is_business_combination,
-    sales_commission, finders_fees, gross_proceeds_used
-)
-VALUES (
-    :sec_filing_id, :issuer_name, :issuer_street, :issuer_city,
-    :issuer_state, :issuer_zip, :issuer_phone, :entity_type,
-    :industry_group_type, :revenue_range, :federal_exemptions,
-    CAST(:total_offering_amount AS DECIMAL(20,2)), CAST(:total_amount_sold AS DECIMAL(20,2)), CAST(:total_remaining AS DECIMAL(20,2)),
-    CAST(:date_of_first_sale AS DATE), CAST(:minimum_investment AS DECIMAL(20,2)), CAST(:total_investors AS INTEGER),
-    CAST(:has_non_accredited_investors AS BOOLEAN), CAST(:is_equity AS BOOLEAN), CAST(:is_pooled_investment AS BOOLEAN),
-    CAST(:is_new_offering AS BOOLEAN), CAST(:more_than_one_year AS BOOLEAN), CAST(:is_business_combination AS BOOLEAN),
-    CAST(:sales_commission AS DECIMAL(20,2)), CAST(:finders_fees AS DECIMAL(20,2)), CAST(:gross_proceeds_used AS DECIMAL(20,2))
-)
-ON CONFLICT (sec_filing_id) DO UPDATE SET
-    issuer_name = COALESCE(EXCLUDED.issuer_name, sec_form_d.issuer_name),
-    issuer_street = COALESCE(EXCLUDED.issuer_street, sec_form_d.issuer_street),
-    issuer_city = COALESCE(EXCLUDED.issuer_city, sec_form_d.issuer_city),
-    issuer_state = COALESCE(EXCLUDED.issuer_state, sec_form_d.issuer_state),
-    issuer_zip = COALESCE(EXCLUDED.issuer_zip, sec_form_d.issuer_zip),
-    issuer_phone = COALESCE(EXCLUDED.issuer_phone, sec_form_d.issuer_phone),
-    entity_type = COALESCE(EXCLUDED.entity_type, sec_form_d.entity_type),
-    industry_group_type = COALESCE(EXCLUDED.industry_group_type, sec_form_d.industry_group_type),
-    revenue_range = COALESCE(EXCLUDED.revenue_range, sec_form_d.revenue_range),
-    federal_exemptions = COALESCE(EXCLUDED.federal_exemptions, sec_form_d.federal_exemptions),
-    total_offering_amount = COALESCE(EXCLUDED.total_offering_amount, sec_form_d.total_offering_amount),
-    total_amount_sold = COALESCE(EXCLUDED.total_amount_sold, sec_form_d.total_amount_sold),
-    total_remaining = COALESCE(EXCLUDED.total_remaining, sec_form_d.total_remaining),
-    date_of_first_sale = COALESCE(EXCLUDED.date_of_first_sale, sec_form_d.date_of_first_sale),
-    minimum_investment = COALESCE(EXCLUDED.minimum_investment, sec_form_d.minimum_investment),
-    total_investors = COALESCE(EXCLUDED.total_investors, sec_form_d.total_investors),
-    has_non_accredited_investors = COALESCE(EXCLUDED.has_non_accredited_investors, sec_form_d.has_non_accredited_investors),
-    is_equity = COALESCE(EXCLUDED.is_equity, sec_form_d.is_equity),
-    is_pooled_investment = COALESCE(EXCLUDED.is_pooled_investment, sec_form_d.is_pooled_investment),
-    is_new_offering = COALESCE(EXCLUDED.is_new_offering, sec_form_d.is_new_offering),
-    more_than_one_year = COALESCE(EXCLUDED.more_than_one_year, sec_form_d.more_than_one_year),
-    is_business_combination = COALESCE(EXCLUDED.is_business_combination, sec_form_d.is_business_combination),
-    sales_commission = COALESCE(EXCLUDED.sales_commission, sec_form_d.sales_commission),
-    finders_fees = COALESCE(EXCLUDED.finders_fees, sec_form_d.finders_fees),
-    gross_proceeds_used = COALESCE(EXCLUDED.gross_proceeds_used, sec_form_d.gross_proceeds_used),
-    updated_on = NOW()
-RETURNING sec_form_d_id AS "secFormDId";
-
 -- name: get_recent_form_d_with_officers
 SELECT sfd.sec_form_d_id AS "secFormDId",
        sfd.issuer_name AS "issuerName",
@@ -365,7 +365,7 @@ class EnrichmentQueries(Protocol):
     """Protocol for enrichment SQL queries."""
 
     async def get_software_companies_without_websites(
-        self, conn: Any, *, limit: int
+        self, conn: Any, *, limit: int, after_cik: str = ""
     ) -> List[Dict[str, Any]]: ...
 
 
@@ -400,14 +400,14 @@ class IngestQueries(Protocol):
     ) -> None: ...
 
     async def get_sec_companies_not_enriched(
-        self, conn: Any, *, limit: int
+        self, conn: Any, *, limit: int, shard: int = 0, shards: int = 1
     ) -> List[Dict[str, Any]]: ...
 
-    async def count_sec_companies(self, conn: Any) -> Optional[int]: ...
+    async def count_sec_companies(self, conn: Any) -> int: ...
 
-    async def count_sec_companies_not_enriched(
-        self, conn: Any
-    ) -> Optional[int]: ...
+    async def sec_companies_exist(self, conn: Any) -> bool: ...
+
+    async def count_sec_companies_not_enriched(self, conn: Any) -> int: ...
 
     async def upsert_sec_company_from_issuer(
         self,
@@ -434,23 +434,19 @@ class IngestQueries(Protocol):
     ) -> Optional[Dict[str, Any]]: ...
 
     async def get_form_d_filings_not_parsed(
-        self, conn: Any, *, limit: int
+        self, conn: Any, *, limit: int, shard: int = 0, shards: int = 1
     ) -> List[Dict[str, Any]]: ...
 
-    async def link_orphaned_filings(self, conn: Any) -> None: ...
+    async def get_form_d_filings_not_parsed_by_accession(
+        self, conn: Any, *, accession_numbers: list[str]
+    ) -> list[dict[str, Any]]: ...
 
-    async def upsert_sec_form_d(
-        self, conn: Any, **kwargs: Any
-    ) -> Optional[Dict[str, Any]]: ...
+    async def link_orphaned_filings(self, conn: Any) -> None: ...
 
-    async def delete_officers_by_form_d(
-        self, conn: Any, *, sec_form_d_id: int
+    async def link_orphaned_filings_for_ciks(
+        self, conn: Any, *, ciks: list[str]
     ) -> None: ...
 
-    async def insert_sec_officer(
-        self, conn: Any, **kwargs: Any
-    ) -> Optional[Dict[str, Any]]: ...
-
     async def get_recent_form_d_with_officers(
         self, conn: Any, *, since_date: Any, limit: int
     ) -> List[Dict[str, Any]]: ...
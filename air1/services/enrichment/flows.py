@@ -16,8 +16,11 @@ from air1.services.enrichment.service import Service
 @task(log_prints=True)
 async def enrich_websites_task(batch_size: int = 100, concurrency: int = 5) -> int:
     """Enrich one batch of companies with website, LinkedIn, and Twitter."""
-    svc = Service(serper_api_key=settings.serper_api_key)
-    return await svc.enrich_websites(batch_size=batch_size, concurrency=concurrency)
+    async with Service(
+        serper_api_key=settings.serper_api_key,
+        serper_max_qps=settings.serper_max_qps,
+    ) as svc:
+        return await svc.enrich_websites(batch_size=batch_size, concurrency=concurrency)
 
 
 # ---------------------------------------------------------------------------
@@ -1,15 +1,35 @@
 """Database repository for company enrichment operations."""
 
+from collections.abc import AsyncIterator
+
 from loguru import logger
 
 from air1.db.prisma_client import get_prisma
 from air1.db.sql_loader import enrichment_queries as queries
 
 
-async def get_companies_without_websites(limit: int = 100) -> list[dict]:
-    """Get Form D software/tech startup companies without websites."""
+async def iter_companies_without_websites(
+    limit: int = 100, chunk: int = 25
+) -> AsyncIterator[list[dict]]:
+    """Yield companies without websites in chunks of `chunk`, up to `limit` total.
+
+    Pages by CIK (the query is DISTINCT ON cik), so callers can start work on
+    the first chunk while the next one is still being fetched.
+    """
     p = await get_prisma()
-    return await queries.get_software_companies_without_websites(p, limit=limit)
+    after_cik = ""
+    remaining = limit
+    while remaining > 0:
+        rows = await queries.get_software_companies_without_websites(
+            p, limit=min(chunk, remaining), after_cik=after_cik
+        )
+        if not rows:
+            return
+        yield rows
+        if len(rows) < min(chunk, remaining):
+            return
+        remaining -= len(rows)
+        after_cik = rows[-1]["cik"]
 
 
 async def update_companies_enrichment_batch(
@@ -29,29 +49,22 @@ async def update_companies_enrichment_batch(
     p = await get_prisma()
 
     try:
-        chunk_size = 500  # 4 params per row = 2000 params max
+        chunk_size = 500
         total_updated = 0
 
         for i in range(0, len(updates), chunk_size):
             chunk = updates[i : i + chunk_size]
-            values_placeholders = []
-            params = []
-
-            for idx, (cik, website, linkedin, twitter) in enumerate(chunk):
-                base = idx * 4 + 1
-                values_placeholders.append(
-                    f"(${base}, ${base + 1}, ${base + 2}, ${base + 3})"
-                )
-                params.extend([cik, website or "", linkedin or "", twitter or ""])
-
-            values_clause = ", ".join(values_placeholders)
-            sql = f"""
+            # One array per column; a NULL fails `!= ''` just like '' does,
+            # so missing URLs keep the existing value
+            params = [list(col) for col in zip(*chunk)]
+            sql = """
                 UPDATE sec_company SET
                     website = CASE WHEN v.website != '' THEN v.website ELSE sec_company.website END,
                     linkedin_url = CASE WHEN v.linkedin != '' THEN v.linkedin ELSE sec_company.linkedin_url END,
                     twitter_url = CASE WHEN v.twitter != '' THEN v.twitter ELSE sec_company.twitter_url END,
                     updated_on = NOW()
-                FROM (VALUES {values_clause}) AS v(cik, website, linkedin, twitter)
+                FROM unnest($1::text[], $2::text[], $3::text[], $4::text[])
+                    AS v(cik, website, linkedin, twitter)
                 WHERE sec_company.cik = v.cik
             """
 
@@ -10,12 +10,14 @@ Setup:
 3. Set SERPER_API_KEY environment variable
 """
 
+import asyncio
 import httpx
+import random
 import re
-from typing import Optional
+import time
 from loguru import logger
 
-JUNK_DOMAINS = {
+JUNK_DOMAINS = frozenset({
     # News/Media
     "bloomberg.com", "forbes.com", "reuters.com", "wsj.com", "nytimes.com",
     "techcrunch.com", "businesswire.com", "prnewswire.com", "marketwatch.com",
@@ -29,58 +31,153 @@ JUNK_DOMAINS = {
     "govtribe.com",
     # Random junk
     "mapquest.com", "issuu.com",
-}
+})
 
-SOCIAL_DOMAINS = {
+SOCIAL_DOMAINS = frozenset({
     "linkedin.com", "twitter.com", "x.com", "facebook.com",
     "instagram.com", "youtube.com", "crunchbase.com", "pitchbook.com",
     "github.com",
-}
+})
+
+TWITTER_DOMAINS = frozenset({"twitter.com", "x.com"})
+
+_TWITTER_HANDLE = re.compile(r"(?:twitter|x)\.com/\w+")
+
+
+def _empty_result() -> dict:
+    return {"website": None, "linkedin": None, "twitter": None, "all_results": []}
+
+
+class _TokenBucket:
+    """Async token bucket: allows `rate` acquisitions per second.
+
+    Bursts up to `rate` acquisitions, but never fewer than one, so rates
+    below 1/s still let a request through every 1/rate seconds.
+    """
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self._capacity = max(rate, 1.0)
+        self._tokens = self._capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
 
 
 class SerperClient:
     """Client for Serper.dev Google Search API."""
 
     BASE_URL = "https://google.serper.dev/search"
+    MAX_RETRIES = 3
 
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, max_qps: float = 5.0):
         self.api_key = api_key
+        # Self-throttle to the plan's QPS rather than discovering it via 429s
+        self._bucket = _TokenBucket(max_qps)
+        # One HTTP/2 connection multiplexes all concurrent searches. Auth
+        # headers live on the client so they are built and encoded once.
+        self._client = httpx.AsyncClient(
+            http2=True,
+            headers={"X-API-KEY": api_key, "Content-Type": "application/json"},
+            timeout=30.0,
+            limits=httpx.Limits(max_connections=10, max_keepalive_connections=10),
+        )
+        # Searches currently on the wire, keyed by query. Concurrent callers
+        # asking for the same company await the same result instead of
+        # spending a second Serper query on it.
+        self._inflight: dict[tuple, asyncio.Future] = {}
+        self._base_payload = {"num": 10}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        await self._client.aclose()
 
     async def search_company(
-        self, company_name: str, city: Optional[str] = None, state: Optional[str] = None
+        self,
+        company_name: str,
+        city: str | None = None,
+        state: str | None = None,
+        want_all: bool = False,
     ) -> dict:
         """Search for a company and return ALL useful URLs from one query.
 
+        Identical concurrent searches are coalesced into a single HTTP call.
+        `all_results` is only populated when `want_all` is set; otherwise
+        result scanning stops once website, LinkedIn, and Twitter are found.
+
         Returns dict: {website, linkedin, twitter, all_results: [{link, title, snippet, domain}]}
         """
+        key = (company_name.lower(), city, state, want_all)
+        pending = self._inflight.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await self._search(company_name, city, state, want_all)
+        except asyncio.CancelledError:
+            # Only the owner was cancelled; waiters get "nothing found"
+            # rather than a cancellation that isn't theirs
+            future.set_result(_empty_result())
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # The owner re-raises it itself; don't also log it as unretrieved
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._inflight[key]
+
+    async def _search(
+        self,
+        company_name: str,
+        city: str | None,
+        state: str | None,
+        want_all: bool,
+    ) -> dict:
+        """Run one Serper query and extract website, LinkedIn, and Twitter."""
         query = company_name
         if city and state:
             query = f"{company_name} {city} {state}"
         elif state:
             query = f"{company_name} {state}"
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            try:
-                response = await client.post(
-                    self.BASE_URL,
-                    headers={
-                        "X-API-KEY": self.api_key,
-                        "Content-Type": "application/json",
-                    },
-                    json={"q": query, "num": 10},
-                )
-                response.raise_for_status()
-                data = response.json()
-
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code == 429:
-                    logger.warning("Serper API quota exceeded")
-                else:
-                    logger.warning(f"Serper API error for {company_name}: {e}")
-                return {"website": None, "linkedin": None, "twitter": None, "all_results": []}
-            except Exception as e:
-                logger.warning(f"Failed to search for {company_name}: {e}")
-                return {"website": None, "linkedin": None, "twitter": None, "all_results": []}
+        try:
+            response = await self._post({**self._base_payload, "q": query})
+            response.raise_for_status()
+            data = response.json()
+
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 429:
+                logger.warning("Serper API quota exceeded")
+            else:
+                logger.warning(f"Serper API error for {company_name}: {e}")
+            return _empty_result()
+        except Exception as e:
+            logger.warning(f"Failed to search for {company_name}: {e}")
+            return _empty_result()
 
         organic = data.get("organic", [])
         website = None
@@ -93,29 +190,39 @@ class SerperClient:
             if not link:
                 continue
 
-            domain = self._extract_domain(link)
+            # Serper already gives the host Google displays; only parse the URL without it
+            displayed = item.get("displayedLink")
+            domain = (
+                displayed and self._displayed_domain(displayed)
+            ) or self._extract_domain(link)
             if not domain or self._is_junk(domain):
                 continue
 
-            all_results.append({
-                "link": link,
-                "title": item.get("title", ""),
-                "snippet": item.get("snippet", ""),
-                "domain": domain,
-            })
+            if want_all:
+                all_results.append({
+                    "link": link,
+                    "title": item.get("title", ""),
+                    "snippet": item.get("snippet", ""),
+                    "domain": domain,
+                })
 
             # Extract LinkedIn company page
-            if "linkedin.com/company/" in link and not linkedin:
-                linkedin = link
+            if self._in_domains(domain, ("linkedin.com",)):
+                if not linkedin and "/company/" in link:
+                    linkedin = link
 
             # Extract Twitter/X
-            elif re.search(r"(twitter\.com|x\.com)/\w+", link) and not twitter:
-                twitter = link
+            elif self._in_domains(domain, TWITTER_DOMAINS):
+                if not twitter and _TWITTER_HANDLE.search(link):
+                    twitter = link
 
             # Extract primary website (first non-social, non-junk result)
-            elif not website and domain not in SOCIAL_DOMAINS:
+            elif not website and not self._in_domains(domain, SOCIAL_DOMAINS):
                 website = link
 
+            if website and linkedin and twitter and not want_all:
+                break
+
         return {
             "website": website,
             "linkedin": linkedin,
@@ -123,22 +230,52 @@ class SerperClient:
             "all_results": all_results,
         }
 
+    async def _post(self, payload: dict) -> httpx.Response:
+        """POST a search, waiting out 429s (per Retry-After) up to MAX_RETRIES times."""
+        for attempt in range(self.MAX_RETRIES + 1):
+            await self._bucket.acquire()
+            response = await self._client.post(self.BASE_URL, json=payload)
+            if response.status_code != 429 or attempt == self.MAX_RETRIES:
+                return response
+
+            delay = self._retry_after(response, default=2.0**attempt)
+            logger.debug(f"Serper rate limited, retrying in {delay:.1f}s")
+            await asyncio.sleep(delay * (1 + 0.1 * random.random()))
+        return response
+
     @staticmethod
-    def _extract_domain(url: str) -> Optional[str]:
+    def _retry_after(response: httpx.Response, default: float) -> float:
+        try:
+            return max(float(response.headers["Retry-After"]), 0.0)
+        except (KeyError, ValueError):
+            return default
+
+    @staticmethod
+    def _extract_domain(url: str) -> str | None:
         try:
             from urllib.parse import urlparse
             parsed = urlparse(url)
             domain = parsed.netloc or parsed.path.split("/")[0]
-            if domain.startswith("www."):
-                domain = domain[4:]
-            return domain.lower()
+            return domain.removeprefix("www.").lower()
         except Exception:
             return None
 
+    @staticmethod
+    def _displayed_domain(displayed: str) -> str | None:
+        """Domain from Serper's displayedLink (e.g. "https://www.acme.com › about")."""
+        host = displayed.split(" ", 1)[0]
+        if "://" in host:
+            host = host.split("://", 1)[1]
+        host = host.split("/", 1)[0].lower()
+        host = host.removeprefix("www.")
+        return host if "." in host else None
+
+    @staticmethod
+    def _in_domains(domain: str, domains) -> bool:
+        # Check exact match and parent domains (e.g. finance.yahoo.com -> yahoo.com)
+        labels = domain.split(".")
+        return any(".".join(labels[i:]) in domains for i in range(len(labels) - 1))
+
     @staticmethod
     def _is_junk(domain: str) -> bool:
-        # Check exact match and subdomains (e.g. finance.yahoo.com)
-        for junk in JUNK_DOMAINS:
-            if domain == junk or domain.endswith("." + junk):
-                return True
-        return False
+        return SerperClient._in_domains(domain, JUNK_DOMAINS)
@@ -0,0 +1,282 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+import pytest_asyncio
+
+from air1.services.enrichment import serper_client
+from air1.services.enrichment.serper_client import SerperClient
+
+
+def _result(website=None, linkedin=None, twitter=None):
+    return {"website": website, "linkedin": linkedin, "twitter": twitter, "all_results": []}
+
+
+@pytest_asyncio.fixture
+async def client():
+    async with SerperClient(api_key="test") as client:
+        yield client
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+class TestSearchCompanyCoalescing:
+    async def test_concurrent_identical_queries_share_one_search(self, client):
+        calls = []
+
+        async def _fake_search(name, city, state, want_all):
+            calls.append((name, city, state))
+            await asyncio.sleep(0.01)
+            return _result(website="https://acme.com")
+
+        client._search = _fake_search
+        results = await asyncio.gather(
+            client.search_company("Acme", city="Austin", state="TX"),
+            client.search_company("ACME", city="Austin", state="TX"),
+            client.search_company("acme", city="Austin", state="TX"),
+        )
+
+        assert len(calls) == 1
+        assert all(r["website"] == "https://acme.com" for r in results)
+        assert client._inflight == {}
+
+    async def test_waiter_outlives_cancelled_owner(self, client):
+        started = asyncio.Event()
+
+        async def _fake_search(name, city, state, want_all):
+            started.set()
+            await asyncio.sleep(10)
+            return _result(website="https://acme.com")
+
+        client._search = _fake_search
+        owner = asyncio.create_task(client.search_company("Acme"))
+        await started.wait()
+        waiter = asyncio.create_task(client.search_company("Acme"))
+        await asyncio.sleep(0)
+        owner.cancel()
+
+        assert await waiter == _result()
+        assert owner.cancelled()
+        assert client._inflight == {}
+
+    async def test_waiter_sees_owner_error(self, client):
+        started = asyncio.Event()
+
+        async def _fake_search(name, city, state, want_all):
+            started.set()
+            await asyncio.sleep(0.01)
+            raise RuntimeError("boom")
+
+        client._search = _fake_search
+        owner = asyncio.create_task(client.search_company("Acme"))
+        await started.wait()
+        waiter = asyncio.create_task(client.search_company("Acme"))
+
+        with pytest.raises(RuntimeError):
+            await owner
+        with pytest.raises(RuntimeError):
+            await waiter
+
+    async def test_different_locations_are_not_coalesced(self, client):
+        calls = []
+
+        async def _fake_search(name, city, state, want_all):
+            calls.append((name, city, state))
+            await asyncio.sleep(0)
+            return _result()
+
+        client._search = _fake_search
+        await asyncio.gather(
+            client.search_company("Acme", state="TX"),
+            client.search_company("Acme", state="CA"),
+        )
+
+        assert len(calls) == 2
+
+    async def test_sequential_queries_search_again(self, client):
+        calls = []
+
+        async def _fake_search(name, city, state, want_all):
+            calls.append(name)
+            return _result()
+
+        client._search = _fake_search
+        await client.search_company("Acme")
+        await client.search_company("Acme")
+
+        assert len(calls) == 2
+
+
+@pytest.mark.unit
+class TestDomainHelpers:
+    def test_is_junk_exact_and_subdomain(self):
+        assert SerperClient._is_junk("bloomberg.com") is True
+        assert SerperClient._is_junk("news.bloomberg.com") is True
+        assert SerperClient._is_junk("notbloomberg.com") is False
+        assert SerperClient._is_junk("acme.com") is False
+
+    def test_extract_domain_strips_www(self):
+        assert SerperClient._extract_domain("https://www.Acme.com/about") == "acme.com"
+
+
+def _mock_serper(monkeypatch, organic=None, handler=None):
+    """Route the client's HTTP calls to `handler`, or to a canned Serper response."""
+    if handler is None:
+        def handler(request):
+            return httpx.Response(200, json={"organic": organic or []})
+
+    real_client = httpx.AsyncClient
+    monkeypatch.setattr(
+        serper_client.httpx,
+        "AsyncClient",
+        lambda **kw: real_client(transport=httpx.MockTransport(handler), **kw),
+    )
+
+
+async def _search(*args, api_key="test", **kwargs):
+    """Run one search on a fresh client, closing it afterwards."""
+    async with SerperClient(api_key=api_key) as client:
+        return await client.search_company(*args, **kwargs)
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+class TestSearchCompanyParsing:
+    async def test_extracts_website_linkedin_twitter(self, monkeypatch):
+        _mock_serper(monkeypatch, [
+            {"link": "https://www.bloomberg.com/profile/acme", "displayedLink": "www.bloomberg.com"},
+            {"link": "https://www.acme.com/", "displayedLink": "https://www.acme.com"},
+            {"link": "https://www.linkedin.com/company/acme", "displayedLink": "www.linkedin.com › company › acme"},
+            {"link": "https://x.com/acmehq"},
+        ])
+        result = await _search("Acme")
+
+        assert result["website"] == "https://www.acme.com/"
+        assert result["linkedin"] == "https://www.linkedin.com/company/acme"
+        assert result["twitter"] == "https://x.com/acmehq"
+        assert result["all_results"] == []
+
+    async def test_domain_ending_in_x_is_not_twitter(self, monkeypatch):
+        _mock_serper(monkeypatch, [{"link": "https://netflix.com/about"}])
+        result = await _search("Netflix")
+
+        assert result["twitter"] is None
+        assert result["website"] == "https://netflix.com/about"
+
+    async def test_twitter_subdomain_is_not_website(self, monkeypatch):
+        _mock_serper(monkeypatch, [
+            {"link": "https://mobile.twitter.com/acmehq"},
+            {"link": "https://acme.com/"},
+        ])
+        result = await _search("Acme")
+
+        assert result["twitter"] == "https://mobile.twitter.com/acmehq"
+        assert result["website"] == "https://acme.com/"
+
+    async def test_linkedin_profile_is_not_website(self, monkeypatch):
+        _mock_serper(monkeypatch, [{"link": "https://uk.linkedin.com/in/jane"}])
+        result = await _search("Acme")
+
+        assert result["linkedin"] is None
+        assert result["website"] is None
+
+    async def test_want_all_collects_results(self, monkeypatch):
+        _mock_serper(monkeypatch, [
+            {"link": "https://acme.com", "title": "Acme", "snippet": "We make things"},
+            {"link": "https://sec.gov/acme"},
+        ])
+        result = await _search("Acme", want_all=True)
+
+        assert result["all_results"] == [{
+            "link": "https://acme.com",
+            "title": "Acme",
+            "snippet": "We make things",
+            "domain": "acme.com",
+        }]
+
+    async def test_request_carries_auth_header_and_query(self, monkeypatch):
+        seen = []
+
+        def handler(request):
+            seen.append(request)
+            return httpx.Response(200, json={"organic": []})
+
+        _mock_serper(monkeypatch, handler=handler)
+        await _search("Acme", city="Austin", state="TX", api_key="secret")
+
+        assert seen[0].headers["X-API-KEY"] == "secret"
+        assert json.loads(seen[0].content) == {"num": 10, "q": "Acme Austin TX"}
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+class TestRateLimiting:
+    async def test_retries_429_honoring_retry_after(self, monkeypatch):
+        responses = [
+            httpx.Response(429, headers={"Retry-After": "3"}),
+            httpx.Response(200, json={"organic": [{"link": "https://acme.com"}]}),
+        ]
+        _mock_serper(monkeypatch, handler=lambda request: responses.pop(0))
+        delays = []
+
+        async def _fake_sleep(delay):
+            delays.append(delay)
+
+        monkeypatch.setattr(serper_client.asyncio, "sleep", _fake_sleep)
+        result = await _search("Acme")
+
+        assert result["website"] == "https://acme.com"
+        assert len(delays) == 1 and 3 <= delays[0] <= 3.3
+
+    async def test_gives_up_after_max_retries(self, monkeypatch):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(429)
+
+        _mock_serper(monkeypatch, handler=handler)
+
+        async def _fake_sleep(delay):
+            pass
+
+        monkeypatch.setattr(serper_client.asyncio, "sleep", _fake_sleep)
+        result = await _search("Acme")
+
+        assert len(calls) == SerperClient.MAX_RETRIES + 1
+        assert result["website"] is None
+
+    async def test_token_bucket_throttles_past_burst(self, monkeypatch):
+        clock = [0.0]
+        monkeypatch.setattr(serper_client.time, "monotonic", lambda: clock[0])
+        waits = []
+
+        async def _fake_sleep(delay):
+            waits.append(delay)
+            clock[0] += delay
+
+        monkeypatch.setattr(serper_client.asyncio, "sleep", _fake_sleep)
+        bucket = serper_client._TokenBucket(rate=2)
+        for _ in range(3):
+            await bucket.acquire()
+
+        assert waits == [0.5]
+
+    async def test_token_bucket_below_one_per_second(self, monkeypatch):
+        clock = [0.0]
+        monkeypatch.setattr(serper_client.time, "monotonic", lambda: clock[0])
+        waits = []
+        real_sleep = asyncio.sleep
+
+        async def _fake_sleep(delay):
+            waits.append(delay)
+            clock[0] += delay
+            await real_sleep(0)  # yield so wait_for can time out a stuck bucket
+
+        monkeypatch.setattr(serper_client.asyncio, "sleep", _fake_sleep)
+        bucket = serper_client._TokenBucket(rate=0.5)
+        await asyncio.wait_for(bucket.acquire(), timeout=1)
+        await asyncio.wait_for(bucket.acquire(), timeout=1)
+
+        assert waits == [2.0]
@@ -24,10 +24,20 @@ class Service(IService):
     """Enrichment service using Serper.dev Google Search.
 
     One query per company returns website + LinkedIn + Twitter.
+
+    Usage:
+        async with Service(serper_api_key="...") as svc:
+            await svc.enrich_websites()
     """
 
-    def __init__(self, serper_api_key: str):
-        self.serper = SerperClient(api_key=serper_api_key)
+    def __init__(self, serper_api_key: str, serper_max_qps: float = 5.0):
+        self.serper = SerperClient(api_key=serper_api_key, max_qps=serper_max_qps)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.serper.aclose()
 
     async def enrich_websites(
         self, batch_size: int = 100, concurrency: int = 5
@@ -36,13 +46,8 @@ class Service(IService):
 
         Returns number of companies that got at least one URL.
         """
-        companies = await repo.get_companies_without_websites(limit=batch_size)
-        if not companies:
-            logger.info("No companies without websites remaining")
-            return 0
-
         logger.info(
-            f"Enriching {len(companies)} companies ({concurrency} concurrent)..."
+            f"Enriching up to {batch_size} companies ({concurrency} concurrent)..."
         )
 
         sem = asyncio.Semaphore(concurrency)
@@ -54,37 +59,56 @@ class Service(IService):
                         company["name"],
                         city=company.get("city"),
                         state=company.get("state"),
+                        want_all=False,
                     )
-                    has_data = result["website"] or result["linkedin"] or result["twitter"]
-                    if has_data:
-                        logger.info(
-                            f"✓ {company['name']}: "
-                            f"web={result['website'] or '-'} "
-                            f"li={result['linkedin'] or '-'} "
-                            f"tw={result['twitter'] or '-'}"
-                        )
-                    return (company["cik"], result)
+                    return (company, result)
                 except Exception as e:
                     logger.warning(
                         f"Failed to enrich {company['name']} (CIK={company['cik']}): {e}"
                     )
                     return None
 
-        results = await asyncio.gather(*[_fetch_one(c) for c in companies])
+        # Start searching each chunk as soon as it is read from the DB
+        tasks: list[asyncio.Task] = []
+        try:
+            async for chunk in repo.iter_companies_without_websites(limit=batch_size):
+                tasks.extend(asyncio.create_task(_fetch_one(c)) for c in chunk)
+        except BaseException:
+            for t in tasks:
+                t.cancel()
+            raise
+
+        if not tasks:
+            logger.info("No companies without websites remaining")
+            return 0
+
+        results = await asyncio.gather(*tasks)
 
         # Collect updates: (cik, website, linkedin, twitter)
         updates = []
+        found_lines = []
         for r in results:
             if r is None:
                 continue
-            cik, data = r
+            company, data = r
             if data["website"] or data["linkedin"] or data["twitter"]:
-                updates.append((cik, data["website"], data["linkedin"], data["twitter"]))
+                updates.append(
+                    (company["cik"], data["website"], data["linkedin"], data["twitter"])
+                )
+                found_lines.append(
+                    f"✓ {company['name']}: "
+                    f"web={data['website'] or '-'} "
+                    f"li={data['linkedin'] or '-'} "
+                    f"tw={data['twitter'] or '-'}"
+                )
 
         if not updates:
             logger.info("No data found for any companies in this batch")
             return 0
 
+        # One log record per batch instead of one per company
+        logger.info("Enrichment summary:\n" + "\n".join(found_lines))
+
         count = await repo.update_companies_enrichment_batch(updates)
-        logger.info(f"Enriched {count}/{len(companies)} companies")
+        logger.info(f"Enriched {count}/{len(tasks)} companies")
         return count
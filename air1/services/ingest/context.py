@@ -0,0 +1,62 @@
+"""Flow-scoped ingest context.
+
+One Service (and one warm Prisma connection) is shared by every task of a
+flow run instead of each task building and tearing down its own.
+
+Usage:
+    async with IngestContext(identity="Company email@co.com"):
+        ...  # tasks call get_service()
+
+    @task
+    async def my_task():
+        async with get_service() as svc:
+            await svc.bootstrap_companies()
+"""
+
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from contextvars import ContextVar, Token
+
+from air1.config import settings
+from air1.db.prisma_client import connect_db, disconnect_db
+from air1.services.ingest.service import Service
+
+_current_service: ContextVar[Service | None] = ContextVar(
+    "ingest_service", default=None
+)
+
+
+class IngestContext:
+    """Owns the Service and DB connection shared by all tasks in a flow run."""
+
+    def __init__(self, identity: str):
+        self._service = Service(identity=identity)
+        self._token: Token | None = None
+
+    async def __aenter__(self) -> Service:
+        try:
+            await connect_db()
+            await self._service.__aenter__()
+        except BaseException:
+            await disconnect_db()
+            raise
+        self._token = _current_service.set(self._service)
+        return self._service
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        _current_service.reset(self._token)
+        try:
+            await self._service.__aexit__(exc_type, exc_val, exc_tb)
+        finally:
+            await disconnect_db()
+
+
+@asynccontextmanager
+async def get_service() -> AsyncIterator[Service]:
+    """Yield the running flow's Service, or a short-lived one outside a flow."""
+    svc = _current_service.get()
+    if svc is not None:
+        yield svc
+        return
+    async with Service(identity=settings.sec_edgar_identity) as svc:
+        yield svc
@@ -0,0 +1,17 @@
+"""Eager fan-out for the ingest pipeline's own concurrent work.
+
+Most coroutines the ingest fan-outs spawn finish, or reach their first real
+I/O, immediately. Starting them inline skips a scheduler round-trip each.
+Only the tasks created here start eagerly: the loop's task factory, and with
+it Prefect's engine and task runner, keeps its normal scheduling.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Coroutine
+from typing import Any
+
+
+def gather_eager(*coros: Coroutine[Any, Any, Any]) -> Awaitable[list]:
+    """Like asyncio.gather(), but each coroutine starts running immediately."""
+    loop = asyncio.get_running_loop()
+    return asyncio.gather(*(asyncio.eager_task_factory(loop, c) for c in coros))
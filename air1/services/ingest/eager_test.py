@@ -0,0 +1,40 @@
+import asyncio
+
+import pytest
+
+from air1.services.ingest.eager import gather_eager
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_gather_eager_starts_coroutines_before_awaiting():
+    started = []
+
+    async def _job(i):
+        started.append(i)
+        await asyncio.sleep(0)
+        return i * 2
+
+    pending = gather_eager(_job(1), _job(2))
+
+    assert started == [1, 2]
+    assert await pending == [2, 4]
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_gather_eager_leaves_loop_task_factory_alone():
+    loop = asyncio.get_running_loop()
+    factory = loop.get_task_factory()
+    started = []
+
+    async def _job():
+        started.append(True)
+
+    await gather_eager(_job())
+    task = asyncio.create_task(_job())
+
+    assert loop.get_task_factory() is factory
+    assert started == [True]
+    await task
+    assert started == [True, True]
@@ -3,10 +3,11 @@
 DAG structure for full pipeline:
 
     bootstrap ──┬──→ enrich (batched)
-                └──→ index ──→ parse (batched)
+                └──→ index ⇉ parse (streamed) ──→ parse backlog (batched)
 
-Enrich and index run in parallel after bootstrap.
-Parse waits for index to complete.
+Enrich and index run in parallel after bootstrap. Parsing streams off the
+index as each chunk is stored; a final batched parse picks up anything
+left unparsed (older filings, failed fetches).
 """
 
 import asyncio
@@ -16,35 +17,61 @@ from loguru import logger
 from prefect import flow, task
 
 from air1.config import settings
-from air1.db.prisma_client import disconnect_db
-from air1.services.ingest.service import Service
+from air1.services.ingest.context import IngestContext, get_service
+from air1.services.ingest.eager import gather_eager
+
+
+async def _run_batches(
+    run_batch, batch_size: int, max_iterations: int, parallel: int
+) -> int:
+    """Run up to `max_iterations` batches, `parallel` at a time.
+
+    Each worker owns one shard of the work queue, so in-flight batches never
+    pick the same rows. A worker doubles its batch size (up to 4x the
+    starting size) while batches come back full, and stops once its shard
+    returns a short batch.
+    """
+    budget = iter(range(max_iterations))
+    max_batch_size = batch_size * 4
+
+    async def _worker(shard: int) -> int:
+        total = 0
+        size = batch_size
+        for _ in budget:
+            done = await run_batch(batch_size=size, shard=shard, shards=parallel)
+            total += done
+            if done < size:
+                break
+            size = min(size * 2, max_batch_size)
+        return total
+
+    return sum(await gather_eager(*[_worker(i) for i in range(parallel)]))
 
 
 # ---------------------------------------------------------------------------
 # Tasks
 # ---------------------------------------------------------------------------
 
+# The batched tasks log through loguru; print() capture (log_prints) is only
+# kept on the one-shot tasks, where its per-call overhead doesn't add up.
+
 
 @task(retries=2, retry_delay_seconds=60, log_prints=True)
 async def bootstrap_companies_task() -> int:
     """Download and store all public companies from SEC."""
-    async with Service(identity=settings.sec_edgar_identity) as svc:
+    async with get_service() as svc:
         return await svc.bootstrap_companies()
 
 
-@task(retries=1, retry_delay_seconds=30, log_prints=True)
+@task(retries=1, retry_delay_seconds=30, log_prints=False)
 async def enrich_companies_task(
-    batch_size: int = 500, max_iterations: int = 25
+    batch_size: int = 500, max_iterations: int = 25, parallel_batches: int = 2
 ) -> int:
     """Enrich unenriched companies in batches until done."""
-    async with Service(identity=settings.sec_edgar_identity) as svc:
-        total = 0
-        for _ in range(max_iterations):
-            enriched = await svc.enrich_companies(batch_size=batch_size)
-            total += enriched
-            if enriched < batch_size:
-                break
-        return total
+    async with get_service() as svc:
+        return await _run_batches(
+            svc.enrich_companies, batch_size, max_iterations, parallel_batches
+        )
 
 
 @task(retries=1, retry_delay_seconds=30, log_prints=True)
@@ -54,39 +81,44 @@ async def ingest_form_d_index_task(
     days: int = 30,
 ) -> int:
     """Fetch Form D filing index for a date range."""
-    async with Service(identity=settings.sec_edgar_identity) as svc:
+    async with get_service() as svc:
         return await svc.ingest_form_d_filings(
             date_start=date_start, date_end=date_end, days=days
         )
 
 
+@task(retries=1, retry_delay_seconds=30, log_prints=False)
+async def ingest_and_parse_form_d_task(
+    days: int = 30, parse_batch: int = 100
+) -> tuple[int, int]:
+    """Fetch the Form D index for a date range, parsing filings as they are stored."""
+    async with get_service() as svc:
+        return await svc.ingest_and_parse_form_d(days=days, parse_batch=parse_batch)
+
+
 @task(retries=1, retry_delay_seconds=30, log_prints=True)
 async def ingest_daily_form_d_task(date_str: Optional[str] = None) -> int:
     """Fetch Form D filings for a single day using the daily index."""
-    async with Service(identity=settings.sec_edgar_identity) as svc:
+    async with get_service() as svc:
         return await svc.ingest_daily_form_d(date_str=date_str)
 
 
 @task(retries=1, retry_delay_seconds=30, log_prints=True)
 async def ingest_current_form_d_task() -> int:
     """Fetch real-time Form D filings from SEC current feed."""
-    async with Service(identity=settings.sec_edgar_identity) as svc:
+    async with get_service() as svc:
         return await svc.ingest_current_form_d()
 
 
-@task(retries=1, retry_delay_seconds=30, log_prints=True)
+@task(retries=1, retry_delay_seconds=30, log_prints=False)
 async def parse_form_d_task(
-    batch_size: int = 100, max_iterations: int = 50
+    batch_size: int = 100, max_iterations: int = 50, parallel_batches: int = 2
 ) -> int:
     """Parse all unparsed Form D filings in batches until done."""
-    async with Service(identity=settings.sec_edgar_identity) as svc:
-        total = 0
-        for _ in range(max_iterations):
-            parsed = await svc.parse_form_d_details(batch_size=batch_size)
-            total += parsed
-            if parsed < batch_size:
-                break
-        return total
+    async with get_service() as svc:
+        return await _run_batches(
+            svc.parse_form_d_details, batch_size, max_iterations, parallel_batches
+        )
 
 
 # ---------------------------------------------------------------------------
@@ -105,29 +137,31 @@ async def full_ingest_flow(
     """Full SEC EDGAR ingestion pipeline (DAG).
 
     bootstrap ──┬──→ enrich
-                └──→ index ──→ parse
+                └──→ index ⇉ parse ──→ parse backlog
 
-    Enrich and index run in parallel after bootstrap.
+    Enrich and index run in parallel after bootstrap; parse streams off index.
     """
-    try:
+    async with IngestContext(identity=settings.sec_edgar_identity):
         # Step 1: Bootstrap (must complete before anything else)
         company_count = await bootstrap_companies_task()
         logger.info(f"Bootstrap complete: {company_count} companies")
 
-        # Step 2+3: Enrich and Index run in parallel
+        # Step 2+3: Enrich and Index (+ streamed parse) run in parallel
         enrich_coro = enrich_companies_task(
             batch_size=enrich_batch_size, max_iterations=enrich_iterations
         )
-        index_coro = ingest_form_d_index_task(days=form_d_days)
+        index_coro = ingest_and_parse_form_d_task(
+            days=form_d_days, parse_batch=form_d_parse_batch
+        )
 
-        total_enriched, form_d_count = await asyncio.gather(
+        total_enriched, (form_d_count, streamed) = await asyncio.gather(
             enrich_coro, index_coro
         )
         logger.info(f"Enrich complete: {total_enriched} companies")
-        logger.info(f"Form D index complete: {form_d_count} filings")
+        logger.info(f"Form D index complete: {form_d_count} filings ({streamed} parsed)")
 
-        # Step 4: Parse (depends on index completing)
-        total_parsed = await parse_form_d_task(
+        # Step 4: Parse whatever the stream left behind
+        total_parsed = streamed + await parse_form_d_task(
             batch_size=form_d_parse_batch, max_iterations=parse_iterations
         )
         logger.info(f"Form D parse complete: {total_parsed} filings")
@@ -138,8 +172,6 @@ async def full_ingest_flow(
             "form_d_indexed": form_d_count,
             "form_d_parsed": total_parsed,
         }
-    finally:
-        await disconnect_db()
 
 
 @flow(name="sec-form-d-daily", log_prints=True)
@@ -149,7 +181,7 @@ async def form_d_daily_flow(
     date_str: Optional[str] = None,
 ):
     """Daily Form D pipeline: fetch yesterday's index + parse all unparsed."""
-    try:
+    async with IngestContext(identity=settings.sec_edgar_identity):
         indexed = await ingest_daily_form_d_task(date_str=date_str)
         logger.info(f"Daily index complete: {indexed} filings")
 
@@ -159,8 +191,6 @@ async def form_d_daily_flow(
         logger.info(f"Parse complete: {total_parsed} filings")
 
         return {"form_d_indexed": indexed, "form_d_parsed": total_parsed}
-    finally:
-        await disconnect_db()
 
 
 @flow(name="sec-form-d-ingest", log_prints=True)
@@ -170,37 +200,33 @@ async def form_d_flow(
     parse_iterations: int = 50,
 ):
     """Fetch and parse Form D filings."""
-    try:
-        indexed = await ingest_form_d_index_task(days=days)
-        logger.info(f"Index complete: {indexed} filings")
+    async with IngestContext(identity=settings.sec_edgar_identity):
+        indexed, streamed = await ingest_and_parse_form_d_task(
+            days=days, parse_batch=parse_batch
+        )
+        logger.info(f"Index complete: {indexed} filings ({streamed} parsed)")
 
-        total_parsed = await parse_form_d_task(
+        total_parsed = streamed + await parse_form_d_task(
             batch_size=parse_batch, max_iterations=parse_iterations
         )
         logger.info(f"Parse complete: {total_parsed} filings")
 
         return {"form_d_indexed": indexed, "form_d_parsed": total_parsed}
-    finally:
-        await disconnect_db()
 
 
 @flow(name="sec-edgar-bootstrap", log_prints=True)
 async def bootstrap_flow():
     """Just bootstrap companies (fast, one-shot)."""
-    try:
+    async with IngestContext(identity=settings.sec_edgar_identity):
         count = await bootstrap_companies_task()
         return {"companies_bootstrapped": count}
-    finally:
-        await disconnect_db()
 
 
 @flow(name="sec-edgar-enrich", log_prints=True)
 async def enrich_flow(batch_size: int = 500, iterations: int = 25):
     """Enrich companies incrementally."""
-    try:
+    async with IngestContext(identity=settings.sec_edgar_identity):
         total = await enrich_companies_task(
             batch_size=batch_size, max_iterations=iterations
         )
         return {"companies_enriched": total}
-    finally:
-        await disconnect_db()
@@ -1,7 +1,14 @@
-"""Data models for SEC EDGAR ingestion."""
+"""Data models for SEC EDGAR ingestion.
 
+Models built straight from loosely-typed SEC data stay Pydantic so their
+input gets validated. Form D results are built by SECClient._parse_form_d,
+which already converts every field explicitly, so they are plain slotted
+dataclasses: no per-instance __dict__ and no validator pass on the parse
+hot path (a single filing can carry dozens of officers).
+"""
+
+from dataclasses import dataclass, field
 from datetime import date
-from decimal import Decimal
 from typing import Optional
 
 from pydantic import BaseModel
@@ -45,7 +52,8 @@ class SecFilingData(BaseModel):
     description: Optional[str] = None
 
 
-class SecOfficerData(BaseModel):
+@dataclass(slots=True, frozen=True)
+class SecOfficerData:
     """Officer/director data from Form D."""
 
     first_name: Optional[str] = None
@@ -57,8 +65,12 @@ class SecOfficerData(BaseModel):
     zip_code: Optional[str] = None
 
 
-class SecFormDData(BaseModel):
-    """Parsed Form D filing data."""
+@dataclass(slots=True, frozen=True)
+class SecFormDData:
+    """Parsed Form D filing data.
+
+    Dollar amounts are whole USD cents (ints), converted once at parse time.
+    """
 
     accession_number: str
     cik: str
@@ -73,11 +85,11 @@ class SecFormDData(BaseModel):
     industry_group_type: Optional[str] = None
     revenue_range: Optional[str] = None
     federal_exemptions: Optional[str] = None
-    total_offering_amount: Optional[Decimal] = None
-    total_amount_sold: Optional[Decimal] = None
-    total_remaining: Optional[Decimal] = None
+    total_offering_amount: Optional[int] = None
+    total_amount_sold: Optional[int] = None
+    total_remaining: Optional[int] = None
     date_of_first_sale: Optional[date] = None
-    minimum_investment: Optional[Decimal] = None
+    minimum_investment: Optional[int] = None
     total_investors: Optional[int] = None
     has_non_accredited_investors: Optional[bool] = None
     is_equity: Optional[bool] = None
@@ -85,7 +97,7 @@ class SecFormDData(BaseModel):
     is_new_offering: Optional[bool] = None
     more_than_one_year: Optional[bool] = None
     is_business_combination: Optional[bool] = None
-    sales_commission: Optional[Decimal] = None
-    finders_fees: Optional[Decimal] = None
-    gross_proceeds_used: Optional[Decimal] = None
-    officers: list[SecOfficerData] = []
+    sales_commission: Optional[int] = None
+    finders_fees: Optional[int] = None
+    gross_proceeds_used: Optional[int] = None
+    officers: list[SecOfficerData] = field(default_factory=list)
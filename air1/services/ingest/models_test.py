@@ -1,6 +1,5 @@
 import pytest
 from datetime import date
-from decimal import Decimal
 
 from pydantic import ValidationError
 
@@ -102,16 +101,16 @@ class TestSecFormDData:
         )
         assert len(f.officers) == 2
 
-    def test_decimal_amounts(self):
+    def test_amounts_in_cents(self):
         f = SecFormDData(
             accession_number="acc",
             cik="1",
             filing_date=date(2025, 1, 1),
-            total_offering_amount=Decimal("1000000.50"),
-            total_amount_sold=Decimal("500000.25"),
-            total_remaining=Decimal("500000.25"),
+            total_offering_amount=100_000_050,
+            total_amount_sold=50_000_025,
+            total_remaining=50_000_025,
         )
-        assert f.total_offering_amount == Decimal("1000000.50")
+        assert f.total_offering_amount == 100_000_050
 
 
 @pytest.mark.unit
@@ -128,3 +127,9 @@ class TestSecOfficerData:
             street="123 Main", city="NY", state="NY", zip_code="10001"
         )
         assert o.title == "CEO"
+
+    def test_slotted_and_frozen(self):
+        o = SecOfficerData(first_name="John")
+        assert not hasattr(o, "__dict__")
+        with pytest.raises(AttributeError):
+            o.first_name = "Jane"
@@ -5,9 +5,15 @@ Error Handling Contract:
 - Unexpected errors: raise domain exceptions (CompanyInsertionError, etc.)
 """
 
+import asyncio
+import json
+from datetime import timedelta
+from operator import attrgetter, itemgetter
+
 from loguru import logger
 from prisma.errors import PrismaError
 
+from air1.config import settings
 from air1.db.prisma_client import get_prisma
 from air1.db.sql_loader import ingest_queries as queries
 from air1.services.ingest.exceptions import (
@@ -22,6 +28,45 @@ from air1.services.ingest.models import (
     SecFormDData,
 )
 
+_COMPANY_FIELDS = attrgetter("cik", "name", "ticker", "exchange")
+_PROFILE_FIELDS = attrgetter(
+    "cik",
+    "sic",
+    "sic_description",
+    "state_of_incorp",
+    "fiscal_year_end",
+    "street",
+    "city",
+    "state_or_country",
+    "zip_code",
+    "phone",
+    "website",
+)
+
+
+def _columns(row_getter, rows: list) -> list[list]:
+    """Transpose non-empty rows into one list per column (the unnest parameters).
+
+    One getter call per row instead of one attribute walk per column.
+    """
+    return [list(col) for col in zip(*map(row_getter, rows))]
+
+
+async def _execute_chunks(prisma, statements: list[tuple[str, list]]) -> int:
+    """Run independent (sql, params) statements concurrently. Returns rows affected.
+
+    Each chunk holds its own pooled connection while it runs, so at most
+    `database_write_concurrency` run at once. Settings keep that below the
+    Prisma pool size; past it, chunks would only queue for a connection.
+    """
+    sem = asyncio.Semaphore(settings.database_write_concurrency)
+
+    async def _run(sql: str, params: list) -> int:
+        async with sem:
+            return await prisma.execute_raw(sql, *params)
+
+    return sum(await asyncio.gather(*(_run(sql, params) for sql, params in statements)))
+
 
 async def upsert_company(company: SecCompanyData) -> tuple[bool, int | None]:
     """Insert or update a SEC company. Returns (success, sec_company_id)."""
@@ -47,39 +92,54 @@ async def upsert_company(company: SecCompanyData) -> tuple[bool, int | None]:
         ) from e
 
 
-async def upsert_companies_batch(companies: list[SecCompanyData]) -> int:
-    """Batch upsert companies via multi-row INSERT. Returns count stored."""
+_COMPANY_INSERT_SQL = """
+    INSERT INTO sec_company (cik, name, ticker, exchange)
+    SELECT * FROM unnest($1::text[], $2::text[], $3::text[], $4::text[])
+"""
+_COMPANY_UPSERT_SQL = _COMPANY_INSERT_SQL + """
+    ON CONFLICT (cik) DO UPDATE SET
+        name = COALESCE(EXCLUDED.name, sec_company.name),
+        ticker = COALESCE(EXCLUDED.ticker, sec_company.ticker),
+        exchange = COALESCE(EXCLUDED.exchange, sec_company.exchange),
+        updated_on = NOW()
+    -- Skip rows the ticker file didn't change so re-runs don't rewrite them
+    WHERE (sec_company.name, sec_company.ticker, sec_company.exchange)
+        IS DISTINCT FROM (
+            COALESCE(EXCLUDED.name, sec_company.name),
+            COALESCE(EXCLUDED.ticker, sec_company.ticker),
+            COALESCE(EXCLUDED.exchange, sec_company.exchange)
+        )
+"""
+_COMPANY_INSERT_NEW_SQL = _COMPANY_INSERT_SQL + "ON CONFLICT (cik) DO NOTHING"
+
+
+async def upsert_companies_batch(
+    companies: list[SecCompanyData], update_existing: bool = True
+) -> int:
+    """Batch upsert companies via multi-row INSERT. Returns count stored.
+
+    The count covers every distinct company in the batch, whether or not its
+    row changed; 0 means the write failed. Existing rows whose values would
+    not change are left untouched, and how many rows were actually written is
+    logged. With `update_existing=False` (first load into an empty table)
+    rows that already exist are skipped instead of updated.
+    """
     if not companies:
         return 0
     try:
         prisma = await get_prisma()
-        # Dedupe by CIK (last wins) — Postgres ON CONFLICT can't handle dupes in same INSERT
-        seen: dict[str, SecCompanyData] = {}
-        for c in companies:
-            seen[c.cik] = c
-        deduped = list(seen.values())
+        # Dedupe by CIK (last wins) — Postgres ON CONFLICT can't handle dupes in same INSERT.
+        # Sorted so concurrent chunks and workers lock rows in the same order.
+        deduped = sorted({c.cik: c for c in companies}.values(), key=attrgetter("cik"))
         chunk_size = 1000
-        total = 0
-        for i in range(0, len(deduped), chunk_size):
-            chunk = deduped[i : i + chunk_size]
-            placeholders = []
-            params: list = []
-            for j, c in enumerate(chunk):
-                off = j * 4
-                placeholders.append(f"(${off+1}, ${off+2}, ${off+3}, ${off+4})")
-                params.extend([c.cik, c.name, c.ticker, c.exchange])
-            values_sql = ", ".join(placeholders)
-            sql = f"""
-                INSERT INTO sec_company (cik, name, ticker, exchange)
-                VALUES {values_sql}
-                ON CONFLICT (cik) DO UPDATE SET
-                    name = COALESCE(EXCLUDED.name, sec_company.name),
-                    ticker = COALESCE(EXCLUDED.ticker, sec_company.ticker),
-                    exchange = COALESCE(EXCLUDED.exchange, sec_company.exchange),
-                    updated_on = NOW()
-            """
-            total += await prisma.execute_raw(sql, *params)
-        return total
+        sql = _COMPANY_UPSERT_SQL if update_existing else _COMPANY_INSERT_NEW_SQL
+        statements = [
+            (sql, _columns(_COMPANY_FIELDS, deduped[i : i + chunk_size]))
+            for i in range(0, len(deduped), chunk_size)
+        ]
+        changed = await _execute_chunks(prisma, statements)
+        logger.info(f"Upserted {len(deduped)} companies ({changed} changed)")
+        return len(deduped)
     except PrismaError as e:
         logger.error(f"Database error batch upserting {len(companies)} companies: {e}")
         return 0
@@ -125,33 +185,15 @@ async def enrich_companies_batch(profiles: list[SecCompanyProfile]) -> int:
         return 0
     try:
         prisma = await get_prisma()
+        # Dedupe by CIK (last wins) so each company is updated once per batch;
+        # sorted so concurrent writers to sec_company lock rows in the same order
+        profiles = sorted({p.cik: p for p in profiles}.values(), key=attrgetter("cik"))
         chunk_size = 1000
-        total = 0
+        statements: list[tuple[str, list]] = []
         for i in range(0, len(profiles), chunk_size):
             chunk = profiles[i : i + chunk_size]
-            placeholders = []
-            params: list = []
-            for j, p in enumerate(chunk):
-                off = j * 11
-                placeholders.append(
-                    f"(${off+1}, ${off+2}, ${off+3}, ${off+4}, ${off+5}, "
-                    f"${off+6}, ${off+7}, ${off+8}, ${off+9}, ${off+10}, ${off+11})"
-                )
-                params.extend([
-                    p.cik,
-                    p.sic,
-                    p.sic_description,
-                    p.state_of_incorp,
-                    p.fiscal_year_end,
-                    p.street,
-                    p.city,
-                    p.state_or_country,
-                    p.zip_code,
-                    p.phone,
-                    p.website,
-                ])
-            values_sql = ", ".join(placeholders)
-            sql = f"""
+            params = _columns(_PROFILE_FIELDS, chunk)
+            sql = """
                 UPDATE sec_company SET
                     sic = COALESCE(v.sic, sec_company.sic),
                     sic_description = COALESCE(v.sic_desc, sec_company.sic_description),
@@ -165,11 +207,14 @@ async def enrich_companies_batch(profiles: list[SecCompanyProfile]) -> int:
                     website = COALESCE(v.website, sec_company.website),
                     enriched_at = NOW(),
                     updated_on = NOW()
-                FROM (VALUES {values_sql}) AS v(cik, sic, sic_desc, state_of_incorp, fiscal_year_end, street, city, state_or_country, zip_code, phone, website)
+                FROM unnest(
+                    $1::text[], $2::text[], $3::text[], $4::text[], $5::text[], $6::text[],
+                    $7::text[], $8::text[], $9::text[], $10::text[], $11::text[]
+                ) AS v(cik, sic, sic_desc, state_of_incorp, fiscal_year_end, street, city, state_or_country, zip_code, phone, website)
                 WHERE sec_company.cik = v.cik
             """
-            total += await prisma.execute_raw(sql, *params)
-        return total
+            statements.append((sql, params))
+        return await _execute_chunks(prisma, statements)
     except PrismaError as e:
         logger.error(f"Database error batch enriching {len(profiles)} companies: {e}")
         return 0
@@ -180,11 +225,19 @@ async def enrich_companies_batch(profiles: list[SecCompanyProfile]) -> int:
         ) from e
 
 
-async def get_companies_not_enriched(limit: int = 500) -> list[dict]:
-    """Get companies that haven't been enriched yet."""
+async def get_companies_not_enriched(
+    limit: int = 500, shard: int = 0, shards: int = 1
+) -> list[dict]:
+    """Get companies that haven't been enriched yet.
+
+    `shard`/`shards` restrict the result to companies whose id falls in one
+    of `shards` disjoint partitions, so concurrent batches never overlap.
+    """
     try:
         prisma = await get_prisma()
-        return await queries.get_sec_companies_not_enriched(prisma, limit=limit) or []
+        return await queries.get_sec_companies_not_enriched(
+            prisma, limit=limit, shard=shard, shards=shards
+        )
     except PrismaError as e:
         logger.error(f"Database error getting unenriched companies: {e}")
         return []
@@ -196,19 +249,27 @@ async def count_companies() -> int:
     """Count total SEC companies."""
     try:
         prisma = await get_prisma()
-        result = await queries.count_sec_companies(prisma)
-        return result or 0
+        return await queries.count_sec_companies(prisma)
     except PrismaError as e:
         logger.error(f"Database error counting companies: {e}")
         return 0
 
 
+async def has_companies() -> bool | None:
+    """Whether any SEC company is stored. None if the check itself failed."""
+    try:
+        prisma = await get_prisma()
+        return await queries.sec_companies_exist(prisma)
+    except PrismaError as e:
+        logger.error(f"Database error checking for companies: {e}")
+        return None
+
+
 async def count_companies_not_enriched() -> int:
     """Count unenriched SEC companies."""
     try:
         prisma = await get_prisma()
-        result = await queries.count_sec_companies_not_enriched(prisma)
-        return result or 0
+        return await queries.count_sec_companies_not_enriched(prisma)
     except PrismaError as e:
         logger.error(f"Database error counting unenriched companies: {e}")
         return 0
@@ -255,27 +316,27 @@ async def upsert_companies_from_issuers_batch(
     """Batch upsert companies from Form D issuer data. Returns count stored.
 
     Each tuple: (cik, name, street, city, state_or_country, zip_code, phone).
+    As with upsert_companies_batch, unchanged rows are not rewritten but
+    still count as stored.
     """
     if not issuers:
         return 0
     try:
         prisma = await get_prisma()
+        # Dedupe by CIK (last wins) — ON CONFLICT can't handle dupes in same INSERT.
+        # Sorted so concurrent writers to sec_company lock rows in the same order.
+        issuers = sorted({row[0]: row for row in issuers}.values(), key=itemgetter(0))
         chunk_size = 1000
-        total = 0
+        statements: list[tuple[str, list]] = []
         for i in range(0, len(issuers), chunk_size):
             chunk = issuers[i : i + chunk_size]
-            placeholders = []
-            params: list = []
-            for j, row in enumerate(chunk):
-                off = j * 7
-                placeholders.append(
-                    f"(${off+1}, ${off+2}, ${off+3}, ${off+4}, ${off+5}, ${off+6}, ${off+7})"
-                )
-                params.extend(row)
-            values_sql = ", ".join(placeholders)
-            sql = f"""
+            # Rows are already tuples; just transpose into one array per column
+            params = [list(col) for col in zip(*chunk)]
+            sql = """
                 INSERT INTO sec_company (cik, name, street, city, state_or_country, zip_code, phone)
-                VALUES {values_sql}
+                SELECT * FROM unnest(
+                    $1::text[], $2::text[], $3::text[], $4::text[], $5::text[], $6::text[], $7::text[]
+                )
                 ON CONFLICT (cik) DO UPDATE SET
                     name = COALESCE(EXCLUDED.name, sec_company.name),
                     street = COALESCE(EXCLUDED.street, sec_company.street),
@@ -284,9 +345,22 @@ async def upsert_companies_from_issuers_batch(
                     zip_code = COALESCE(EXCLUDED.zip_code, sec_company.zip_code),
                     phone = COALESCE(EXCLUDED.phone, sec_company.phone),
                     updated_on = NOW()
+                -- Issuers recur across filings; leave unchanged rows alone
+                WHERE (
+                    sec_company.name, sec_company.street, sec_company.city,
+                    sec_company.state_or_country, sec_company.zip_code, sec_company.phone
+                ) IS DISTINCT FROM (
+                    COALESCE(EXCLUDED.name, sec_company.name),
+                    COALESCE(EXCLUDED.street, sec_company.street),
+                    COALESCE(EXCLUDED.city, sec_company.city),
+                    COALESCE(EXCLUDED.state_or_country, sec_company.state_or_country),
+                    COALESCE(EXCLUDED.zip_code, sec_company.zip_code),
+                    COALESCE(EXCLUDED.phone, sec_company.phone)
+                )
             """
-            total += await prisma.execute_raw(sql, *params)
-        return total
+            statements.append((sql, params))
+        await _execute_chunks(prisma, statements)
+        return len(issuers)
     except PrismaError as e:
         logger.error(f"Database error batch upserting {len(issuers)} issuer companies: {e}")
         return 0
@@ -297,11 +371,18 @@ async def upsert_companies_from_issuers_batch(
         ) from e
 
 
-async def link_orphaned_filings() -> None:
-    """Link filings with sec_company_id=NULL to their companies by CIK."""
+async def link_orphaned_filings(ciks: list[str] | None = None) -> None:
+    """Link filings with sec_company_id=NULL to their companies by CIK.
+
+    Pass `ciks` to only touch those companies' filings instead of scanning
+    every orphaned filing in the table.
+    """
     try:
         prisma = await get_prisma()
-        await queries.link_orphaned_filings(prisma)
+        if ciks is None:
+            await queries.link_orphaned_filings(prisma)
+        elif ciks:
+            await queries.link_orphaned_filings_for_ciks(prisma, ciks=ciks)
         logger.info("Linked orphaned filings to companies")
     except PrismaError as e:
         logger.error(f"Database error linking orphaned filings: {e}")
@@ -338,43 +419,59 @@ async def upsert_filing(filing: SecFilingData) -> tuple[bool, int | None]:
         ) from e
 
 
+_FILING_UPSERT_SQL = """
+    WITH v AS (
+        SELECT * FROM unnest($1::text[], $2::text[], $3::text[], $4::date[], $5::text[])
+            AS v(accession_number, cik, form_type, filing_date, company_name)
+    ),
+    ins AS (
+        INSERT INTO sec_filing (accession_number, cik, form_type, filing_date, company_name)
+        SELECT * FROM v
+        ON CONFLICT (accession_number) DO NOTHING
+        RETURNING accession_number
+    ),
+    upd AS (
+        -- Only rows that already existed; new ones were fully written above
+        UPDATE sec_filing SET
+            form_type = v.form_type,
+            company_name = COALESCE(v.company_name, sec_filing.company_name),
+            updated_on = NOW()
+        FROM v
+        WHERE sec_filing.accession_number = v.accession_number
+          AND v.accession_number NOT IN (SELECT accession_number FROM ins)
+        RETURNING 1
+    )
+    SELECT ((SELECT count(*) FROM ins) + (SELECT count(*) FROM upd))::int AS "stored"
+"""
+
+
 async def upsert_filings_batch(filings: list[SecFilingData]) -> int:
-    """Batch upsert filings in a single SQL query. Returns count stored."""
+    """Batch upsert filings in a single SQL statement. Returns count stored.
+
+    Almost every filing in a daily index is new, so rows are inserted with
+    DO NOTHING and only the ones that already existed get the update. Callers
+    chunk large inputs; each call is one atomic statement.
+    """
     if not filings:
         return 0
     try:
         prisma = await get_prisma()
-        # Dedupe by accession_number (last wins) — ON CONFLICT can't handle dupes in same INSERT
-        seen: dict[str, SecFilingData] = {}
-        for f in filings:
-            seen[f.accession_number] = f
-        filings = list(seen.values())
-        # Build multi-row VALUES for a single INSERT
-        placeholders = []
-        params: list = []
-        for i, f in enumerate(filings):
-            off = i * 5
-            placeholders.append(
-                f"(${off+1}, ${off+2}, ${off+3}, ${off+4}::DATE, ${off+5})"
-            )
-            params.extend([
-                f.accession_number,
-                f.cik,
-                f.form_type,
-                f.filing_date.isoformat(),
-                f.company_name,
-            ])
-        values_sql = ", ".join(placeholders)
-        sql = f"""
-            INSERT INTO sec_filing (accession_number, cik, form_type, filing_date, company_name)
-            VALUES {values_sql}
-            ON CONFLICT (accession_number) DO UPDATE SET
-                form_type = EXCLUDED.form_type,
-                company_name = COALESCE(EXCLUDED.company_name, sec_filing.company_name),
-                updated_on = NOW()
-        """
-        await prisma.execute_raw(sql, *params)
-        return len(filings)
+        # Dedupe by accession_number (last wins) — ON CONFLICT can't handle dupes
+        # in same INSERT. Sorted so concurrent chunks lock rows in the same order.
+        filings = sorted(
+            {f.accession_number: f for f in filings}.values(),
+            key=attrgetter("accession_number"),
+        )
+        # One array per column: the SQL text stays the same size for any batch
+        result = await prisma.query_raw(
+            _FILING_UPSERT_SQL,
+            [f.accession_number for f in filings],
+            [f.cik for f in filings],
+            [f.form_type for f in filings],
+            [f.filing_date.isoformat() for f in filings],
+            [f.company_name for f in filings],
+        )
+        return result[0]["stored"] if result else 0
     except PrismaError as e:
         logger.error(f"Database error batch upserting {len(filings)} filings: {e}")
         return 0
@@ -385,12 +482,14 @@ async def upsert_filings_batch(filings: list[SecFilingData]) -> int:
         ) from e
 
 
-async def get_form_d_filings_not_parsed(limit: int = 100) -> list[dict]:
-    """Get Form D filings that haven't been parsed yet."""
+async def get_form_d_filings_not_parsed(
+    limit: int = 100, shard: int = 0, shards: int = 1
+) -> list[dict]:
+    """Get Form D filings that haven't been parsed yet (optionally one shard of them)."""
     try:
         prisma = await get_prisma()
-        return (
-            await queries.get_form_d_filings_not_parsed(prisma, limit=limit) or []
+        return await queries.get_form_d_filings_not_parsed(
+            prisma, limit=limit, shard=shard, shards=shards
         )
     except PrismaError as e:
         logger.error(f"Database error getting unparsed Form D filings: {e}")
@@ -399,82 +498,226 @@ async def get_form_d_filings_not_parsed(limit: int = 100) -> list[dict]:
         raise QueryError(f"Failed to get unparsed Form D filings: {e}") from e
 
 
+async def get_form_d_filings_not_parsed_by_accession(
+    accession_numbers: list[str],
+) -> list[dict]:
+    """Get the unparsed Form D filings among the given accession numbers."""
+    if not accession_numbers:
+        return []
+    try:
+        prisma = await get_prisma()
+        return await queries.get_form_d_filings_not_parsed_by_accession(
+            prisma, accession_numbers=accession_numbers
+        )
+    except PrismaError as e:
+        logger.error(f"Database error getting unparsed Form D filings by accession: {e}")
+        return []
+    except Exception as e:
+        raise QueryError(
+            f"Failed to get unparsed Form D filings by accession: {e}"
+        ) from e
+
+
+# Prisma's default interactive-transaction timeout is 5s; a 1000-row Form D
+# batch with its officers can take longer than that.
+_BATCH_TX_TIMEOUT = timedelta(seconds=60)
+
+
+def _cents(val: int | None) -> str | None:
+    return str(val) if val is not None else None
+
+
+def _bool(val: bool | None) -> str | None:
+    return str(val).lower() if val is not None else None
+
+
+def _form_d_row(fd: SecFormDData, sec_filing_id: int) -> tuple:
+    """Serialize a Form D into sec_form_d column order for the batch insert."""
+    return (
+        sec_filing_id,
+        fd.issuer_name,
+        fd.issuer_street,
+        fd.issuer_city,
+        fd.issuer_state,
+        fd.issuer_zip,
+        fd.issuer_phone,
+        fd.entity_type,
+        fd.industry_group_type,
+        fd.revenue_range,
+        fd.federal_exemptions,
+        _cents(fd.total_offering_amount),
+        _cents(fd.total_amount_sold),
+        _cents(fd.total_remaining),
+        fd.date_of_first_sale.isoformat() if fd.date_of_first_sale else None,
+        _cents(fd.minimum_investment),
+        str(fd.total_investors) if fd.total_investors is not None else None,
+        _bool(fd.has_non_accredited_investors),
+        _bool(fd.is_equity),
+        _bool(fd.is_pooled_investment),
+        _bool(fd.is_new_offering),
+        _bool(fd.more_than_one_year),
+        _bool(fd.is_business_combination),
+        _cents(fd.sales_commission),
+        _cents(fd.finders_fees),
+        _cents(fd.gross_proceeds_used),
+    )
+
+
+def _officer_rows(sec_filing_id: int, officers) -> list[dict]:
+    """Officer records shaped for the jsonb_to_recordset in _FORM_D_SAVE_SQL."""
+    return [
+        {
+            "sec_filing_id": sec_filing_id,
+            "first_name": o.first_name,
+            "last_name": o.last_name,
+            "title": o.title,
+            "street": o.street,
+            "city": o.city,
+            "state": o.state,
+            "zip_code": o.zip_code,
+        }
+        for o in officers
+    ]
+
+
+# Upsert a set of Form Ds and sync their officers in one statement. Officers
+# arrive as one JSONB parameter keyed by sec_filing_id and are joined back to
+# the upserted rows. Only the delta is written: officers no longer listed are
+# deleted, new ones inserted, and unchanged ones (the usual case on re-parse)
+# are left alone. IS NOT DISTINCT FROM makes NULL fields compare equal.
+_FORM_D_SAVE_SQL = """
+    WITH fd AS (
+        INSERT INTO sec_form_d (
+            sec_filing_id, issuer_name, issuer_street, issuer_city,
+            issuer_state, issuer_zip, issuer_phone, entity_type,
+            industry_group_type, revenue_range, federal_exemptions,
+            total_offering_amount, total_amount_sold, total_remaining,
+            date_of_first_sale, minimum_investment, total_investors,
+            has_non_accredited_investors, is_equity, is_pooled_investment,
+            is_new_offering, more_than_one_year, is_business_combination,
+            sales_commission, finders_fees, gross_proceeds_used
+        )
+        SELECT
+            t.sec_filing_id, t.issuer_name, t.issuer_street, t.issuer_city,
+            t.issuer_state, t.issuer_zip, t.issuer_phone, t.entity_type,
+            t.industry_group_type, t.revenue_range, t.federal_exemptions,
+            t.total_offering_amount / 100.0, t.total_amount_sold / 100.0, t.total_remaining / 100.0,
+            t.date_of_first_sale, t.minimum_investment / 100.0, t.total_investors,
+            t.has_non_accredited_investors, t.is_equity, t.is_pooled_investment,
+            t.is_new_offering, t.more_than_one_year, t.is_business_combination,
+            t.sales_commission / 100.0, t.finders_fees / 100.0, t.gross_proceeds_used / 100.0
+        FROM unnest(
+            $1::int[], $2::text[], $3::text[], $4::text[],
+            $5::text[], $6::text[], $7::text[], $8::text[],
+            $9::text[], $10::text[], $11::text[],
+            $12::bigint[], $13::bigint[], $14::bigint[],
+            $15::date[], $16::bigint[], $17::int[],
+            $18::boolean[], $19::boolean[], $20::boolean[],
+            $21::boolean[], $22::boolean[], $23::boolean[],
+            $24::bigint[], $25::bigint[], $26::bigint[]
+        ) AS t(
+            sec_filing_id, issuer_name, issuer_street, issuer_city,
+            issuer_state, issuer_zip, issuer_phone, entity_type,
+            industry_group_type, revenue_range, federal_exemptions,
+            total_offering_amount, total_amount_sold, total_remaining,
+            date_of_first_sale, minimum_investment, total_investors,
+            has_non_accredited_investors, is_equity, is_pooled_investment,
+            is_new_offering, more_than_one_year, is_business_combination,
+            sales_commission, finders_fees, gross_proceeds_used
+        )
+        ON CONFLICT (sec_filing_id) DO UPDATE SET
+            issuer_name = COALESCE(EXCLUDED.issuer_name, sec_form_d.issuer_name),
+            issuer_street = COALESCE(EXCLUDED.issuer_street, sec_form_d.issuer_street),
+            issuer_city = COALESCE(EXCLUDED.issuer_city, sec_form_d.issuer_city),
+            issuer_state = COALESCE(EXCLUDED.issuer_state, sec_form_d.issuer_state),
+            issuer_zip = COALESCE(EXCLUDED.issuer_zip, sec_form_d.issuer_zip),
+            issuer_phone = COALESCE(EXCLUDED.issuer_phone, sec_form_d.issuer_phone),
+            entity_type = COALESCE(EXCLUDED.entity_type, sec_form_d.entity_type),
+            industry_group_type = COALESCE(EXCLUDED.industry_group_type, sec_form_d.industry_group_type),
+            revenue_range = COALESCE(EXCLUDED.revenue_range, sec_form_d.revenue_range),
+            federal_exemptions = COALESCE(EXCLUDED.federal_exemptions, sec_form_d.federal_exemptions),
+            total_offering_amount = COALESCE(EXCLUDED.total_offering_amount, sec_form_d.total_offering_amount),
+            total_amount_sold = COALESCE(EXCLUDED.total_amount_sold, sec_form_d.total_amount_sold),
+            total_remaining = COALESCE(EXCLUDED.total_remaining, sec_form_d.total_remaining),
+            date_of_first_sale = COALESCE(EXCLUDED.date_of_first_sale, sec_form_d.date_of_first_sale),
+            minimum_investment = COALESCE(EXCLUDED.minimum_investment, sec_form_d.minimum_investment),
+            total_investors = COALESCE(EXCLUDED.total_investors, sec_form_d.total_investors),
+            has_non_accredited_investors = COALESCE(EXCLUDED.has_non_accredited_investors, sec_form_d.has_non_accredited_investors),
+            is_equity = COALESCE(EXCLUDED.is_equity, sec_form_d.is_equity),
+            is_pooled_investment = COALESCE(EXCLUDED.is_pooled_investment, sec_form_d.is_pooled_investment),
+            is_new_offering = COALESCE(EXCLUDED.is_new_offering, sec_form_d.is_new_offering),
+            more_than_one_year = COALESCE(EXCLUDED.more_than_one_year, sec_form_d.more_than_one_year),
+            is_business_combination = COALESCE(EXCLUDED.is_business_combination, sec_form_d.is_business_combination),
+            sales_commission = COALESCE(EXCLUDED.sales_commission, sec_form_d.sales_commission),
+            finders_fees = COALESCE(EXCLUDED.finders_fees, sec_form_d.finders_fees),
+            gross_proceeds_used = COALESCE(EXCLUDED.gross_proceeds_used, sec_form_d.gross_proceeds_used),
+            updated_on = NOW()
+        RETURNING sec_form_d_id, sec_filing_id
+    ),
+    new AS (
+        SELECT fd.sec_form_d_id, o.first_name, o.last_name, o.title,
+               o.street, o.city, o.state, o.zip_code
+        FROM jsonb_to_recordset($27::jsonb) AS o(
+            sec_filing_id BIGINT, first_name TEXT, last_name TEXT, title TEXT,
+            street TEXT, city TEXT, state TEXT, zip_code TEXT
+        )
+        JOIN fd USING (sec_filing_id)
+    ),
+    stale AS (
+        DELETE FROM sec_officer s
+        USING fd
+        WHERE s.sec_form_d_id = fd.sec_form_d_id
+          AND NOT EXISTS (
+              SELECT 1 FROM new n
+              WHERE n.sec_form_d_id = s.sec_form_d_id
+                AND (n.first_name, n.last_name, n.title, n.street, n.city, n.state, n.zip_code)
+                    IS NOT DISTINCT FROM
+                    (s.first_name, s.last_name, s.title, s.street, s.city, s.state, s.zip_code)
+          )
+    ),
+    added AS (
+        INSERT INTO sec_officer (sec_form_d_id, first_name, last_name, title, street, city, state, zip_code)
+        SELECT n.sec_form_d_id, n.first_name, n.last_name, n.title, n.street, n.city, n.state, n.zip_code
+        FROM new n
+        WHERE NOT EXISTS (
+            SELECT 1 FROM sec_officer s
+            WHERE s.sec_form_d_id = n.sec_form_d_id
+              AND (s.first_name, s.last_name, s.title, s.street, s.city, s.state, s.zip_code)
+                  IS NOT DISTINCT FROM
+                  (n.first_name, n.last_name, n.title, n.street, n.city, n.state, n.zip_code)
+        )
+    )
+    SELECT sec_form_d_id AS "secFormDId" FROM fd
+"""
+
+
+def _form_d_save_params(items: list[tuple[SecFormDData, int]]) -> list:
+    """Parameters for _FORM_D_SAVE_SQL: one array per column, then the officers."""
+    params = [list(col) for col in zip(*(_form_d_row(fd, fid) for fd, fid in items))]
+    params.append(
+        json.dumps([
+            row for fd, fid in items for row in _officer_rows(fid, fd.officers)
+        ])
+    )
+    return params
+
+
 async def save_form_d_complete(
     form_d: SecFormDData, sec_filing_id: int
 ) -> tuple[bool, int | None]:
     """Save Form D data with officers atomically. Returns (success, sec_form_d_id).
 
-    Uses a database transaction so that if any officer insert fails,
-    the entire operation is rolled back (no partial state).
+    The Form D upsert and the officer sync are a single statement, so either
+    both apply or neither does (no partial state).
     """
     try:
         prisma = await get_prisma()
-
-        def _dec(val):
-            return str(val) if val is not None else None
-
-        def _bool(val):
-            return str(val).lower() if val is not None else None
-
-        # Begin transaction
-        await prisma.query_raw("BEGIN")
-        try:
-            form_d_result = await queries.upsert_sec_form_d(
-                prisma,
-                sec_filing_id=sec_filing_id,
-                issuer_name=form_d.issuer_name,
-                issuer_street=form_d.issuer_street,
-                issuer_city=form_d.issuer_city,
-                issuer_state=form_d.issuer_state,
-                issuer_zip=form_d.issuer_zip,
-                issuer_phone=form_d.issuer_phone,
-                entity_type=form_d.entity_type,
-                industry_group_type=form_d.industry_group_type,
-                revenue_range=form_d.revenue_range,
-                federal_exemptions=form_d.federal_exemptions,
-                total_offering_amount=_dec(form_d.total_offering_amount),
-                total_amount_sold=_dec(form_d.total_amount_sold),
-                total_remaining=_dec(form_d.total_remaining),
-                date_of_first_sale=form_d.date_of_first_sale.isoformat() if form_d.date_of_first_sale else None,
-                minimum_investment=_dec(form_d.minimum_investment),
-                total_investors=str(form_d.total_investors) if form_d.total_investors is not None else None,
-                has_non_accredited_investors=_bool(form_d.has_non_accredited_investors),
-                is_equity=_bool(form_d.is_equity),
-                is_pooled_investment=_bool(form_d.is_pooled_investment),
-                is_new_offering=_bool(form_d.is_new_offering),
-                more_than_one_year=_bool(form_d.more_than_one_year),
-                is_business_combination=_bool(form_d.is_business_combination),
-                sales_commission=_dec(form_d.sales_commission),
-                finders_fees=_dec(form_d.finders_fees),
-                gross_proceeds_used=_dec(form_d.gross_proceeds_used),
-            )
-            if not form_d_result:
-                await prisma.query_raw("ROLLBACK")
-                return False, None
-
-            form_d_id = form_d_result["secFormDId"]
-
-            # Delete existing officers before re-inserting (prevents duplicates on re-parse)
-            await queries.delete_officers_by_form_d(prisma, sec_form_d_id=form_d_id)
-
-            for officer in form_d.officers:
-                await queries.insert_sec_officer(
-                    prisma,
-                    sec_form_d_id=form_d_id,
-                    first_name=officer.first_name,
-                    last_name=officer.last_name,
-                    title=officer.title,
-                    street=officer.street,
-                    city=officer.city,
-                    state=officer.state,
-                    zip_code=officer.zip_code,
-                )
-
-            await prisma.query_raw("COMMIT")
-            return True, form_d_id
-        except Exception:
-            await prisma.query_raw("ROLLBACK")
-            raise
+        result = await prisma.query_raw(
+            _FORM_D_SAVE_SQL, *_form_d_save_params([(form_d, sec_filing_id)])
+        )
+        if not result:
+            return False, None
+        return True, result[0]["secFormDId"]
     except PrismaError as e:
         logger.error(f"Database error saving Form D {form_d.accession_number}: {e}")
         return False, None
@@ -490,165 +733,33 @@ async def save_form_d_complete(
 async def save_form_d_batch(
     items: list[tuple[SecFormDData, int]],
 ) -> int:
-    """Batch save Form D records with officers in 3 queries + transaction.
+    """Batch save Form D records with their officers, one statement per chunk.
 
     Each item is (SecFormDData, sec_filing_id). Returns count saved.
     """
     if not items:
         return 0
 
-    def _dec(val):
-        return str(val) if val is not None else None
-
-    def _bool(val):
-        return str(val).lower() if val is not None else None
-
     try:
         prisma = await get_prisma()
         # Dedupe by sec_filing_id (last wins)
-        seen: dict[int, tuple[SecFormDData, int]] = {}
-        for fd, fid in items:
-            seen[fid] = (fd, fid)
-        items = list(seen.values())
-        await prisma.query_raw("BEGIN")
-        try:
-            # Step 1: Multi-row INSERT for form_d records with RETURNING
-            chunk_size = 1000
-            form_d_ids: list[int] = []  # parallel to items
-
-            for i in range(0, len(items), chunk_size):
-                chunk = items[i : i + chunk_size]
-                placeholders = []
-                params: list = []
-                for j, (fd, filing_id) in enumerate(chunk):
-                    off = j * 26
-                    placeholders.append(
-                        f"(${off+1}::INT, ${off+2}, ${off+3}, ${off+4}, "
-                        f"${off+5}, ${off+6}, ${off+7}, ${off+8}, "
-                        f"${off+9}, ${off+10}, ${off+11}, "
-                        f"CAST(${off+12} AS DECIMAL(20,2)), CAST(${off+13} AS DECIMAL(20,2)), CAST(${off+14} AS DECIMAL(20,2)), "
-                        f"CAST(${off+15} AS DATE), CAST(${off+16} AS DECIMAL(20,2)), CAST(${off+17} AS INTEGER), "
-                        f"CAST(${off+18} AS BOOLEAN), CAST(${off+19} AS BOOLEAN), CAST(${off+20} AS BOOLEAN), "
-                        f"CAST(${off+21} AS BOOLEAN), CAST(${off+22} AS BOOLEAN), CAST(${off+23} AS BOOLEAN), "
-                        f"CAST(${off+24} AS DECIMAL(20,2)), CAST(${off+25} AS DECIMAL(20,2)), CAST(${off+26} AS DECIMAL(20,2)))"
-                    )
-                    params.extend([
-                        filing_id,
-                        fd.issuer_name,
-                        fd.issuer_street,
-                        fd.issuer_city,
-                        fd.issuer_state,
-                        fd.issuer_zip,
-                        fd.issuer_phone,
-                        fd.entity_type,
-                        fd.industry_group_type,
-                        fd.revenue_range,
-                        fd.federal_exemptions,
-                        _dec(fd.total_offering_amount),
-                        _dec(fd.total_amount_sold),
-                        _dec(fd.total_remaining),
-                        fd.date_of_first_sale.isoformat() if fd.date_of_first_sale else None,
-                        _dec(fd.minimum_investment),
-                        str(fd.total_investors) if fd.total_investors is not None else None,
-                        _bool(fd.has_non_accredited_investors),
-                        _bool(fd.is_equity),
-                        _bool(fd.is_pooled_investment),
-                        _bool(fd.is_new_offering),
-                        _bool(fd.more_than_one_year),
-                        _bool(fd.is_business_combination),
-                        _dec(fd.sales_commission),
-                        _dec(fd.finders_fees),
-                        _dec(fd.gross_proceeds_used),
-                    ])
-                values_sql = ", ".join(placeholders)
-                sql = f"""
-                    INSERT INTO sec_form_d (
-                        sec_filing_id, issuer_name, issuer_street, issuer_city,
-                        issuer_state, issuer_zip, issuer_phone, entity_type,
-                        industry_group_type, revenue_range, federal_exemptions,
-                        total_offering_amount, total_amount_sold, total_remaining,
-                        date_of_first_sale, minimum_investment, total_investors,
-                        has_non_accredited_investors, is_equity, is_pooled_investment,
-                        is_new_offering, more_than_one_year, is_business_combination,
-                        sales_commission, finders_fees, gross_proceeds_used
-                    )
-                    VALUES {values_sql}
-                    ON CONFLICT (sec_filing_id) DO UPDATE SET
-                        issuer_name = COALESCE(EXCLUDED.issuer_name, sec_form_d.issuer_name),
-                        issuer_street = COALESCE(EXCLUDED.issuer_street, sec_form_d.issuer_street),
-                        issuer_city = COALESCE(EXCLUDED.issuer_city, sec_form_d.issuer_city),
-                        issuer_state = COALESCE(EXCLUDED.issuer_state, sec_form_d.issuer_state),
-                        issuer_zip = COALESCE(EXCLUDED.issuer_zip, sec_form_d.issuer_zip),
-                        issuer_phone = COALESCE(EXCLUDED.issuer_phone, sec_form_d.issuer_phone),
-                        entity_type = COALESCE(EXCLUDED.entity_type, sec_form_d.entity_type),
-                        industry_group_type = COALESCE(EXCLUDED.industry_group_type, sec_form_d.industry_group_type),
-                        revenue_range = COALESCE(EXCLUDED.revenue_range, sec_form_d.revenue_range),
-                        federal_exemptions = COALESCE(EXCLUDED.federal_exemptions, sec_form_d.federal_exemptions),
-                        total_offering_amount = COALESCE(EXCLUDED.total_offering_amount, sec_form_d.total_offering_amount),
-                        total_amount_sold = COALESCE(EXCLUDED.total_amount_sold, sec_form_d.total_amount_sold),
-                        total_remaining = COALESCE(EXCLUDED.total_remaining, sec_form_d.total_remaining),
-                        date_of_first_sale = COALESCE(EXCLUDED.date_of_first_sale, sec_form_d.date_of_first_sale),
-                        minimum_investment = COALESCE(EXCLUDED.minimum_investment, sec_form_d.minimum_investment),
-                        total_investors = COALESCE(EXCLUDED.total_investors, sec_form_d.total_investors),
-                        has_non_accredited_investors = COALESCE(EXCLUDED.has_non_accredited_investors, sec_form_d.has_non_accredited_investors),
-                        is_equity = COALESCE(EXCLUDED.is_equity, sec_form_d.is_equity),
-                        is_pooled_investment = COALESCE(EXCLUDED.is_pooled_investment, sec_form_d.is_pooled_investment),
-                        is_new_offering = COALESCE(EXCLUDED.is_new_offering, sec_form_d.is_new_offering),
-                        more_than_one_year = COALESCE(EXCLUDED.more_than_one_year, sec_form_d.more_than_one_year),
-                        is_business_combination = COALESCE(EXCLUDED.is_business_combination, sec_form_d.is_business_combination),
-                        sales_commission = COALESCE(EXCLUDED.sales_commission, sec_form_d.sales_commission),
-                        finders_fees = COALESCE(EXCLUDED.finders_fees, sec_form_d.finders_fees),
-                        gross_proceeds_used = COALESCE(EXCLUDED.gross_proceeds_used, sec_form_d.gross_proceeds_used),
-                        updated_on = NOW()
-                    RETURNING sec_form_d_id AS "secFormDId"
-                """
-                rows = await prisma.query_raw(sql, *params)
-                form_d_ids.extend(r["secFormDId"] for r in rows)
-
-            # Step 2: Delete all existing officers for these form_d records
-            if form_d_ids:
-                await prisma.execute_raw(
-                    "DELETE FROM sec_officer WHERE sec_form_d_id = ANY($1::int[])",
-                    form_d_ids,
-                )
-
-            # Step 3: Multi-row INSERT for all officers
-            all_officers: list[tuple] = []
-            for (fd, _), fid in zip(items, form_d_ids):
-                for off_data in fd.officers:
-                    all_officers.append((
-                        fid,
-                        off_data.first_name,
-                        off_data.last_name,
-                        off_data.title,
-                        off_data.street,
-                        off_data.city,
-                        off_data.state,
-                        off_data.zip_code,
-                    ))
-
-            for i in range(0, len(all_officers), chunk_size):
-                chunk = all_officers[i : i + chunk_size]
-                placeholders = []
-                params = []
-                for j, row in enumerate(chunk):
-                    off = j * 8
-                    placeholders.append(
-                        f"(${off+1}::INT, ${off+2}, ${off+3}, ${off+4}, ${off+5}, ${off+6}, ${off+7}, ${off+8})"
-                    )
-                    params.extend(row)
-                values_sql = ", ".join(placeholders)
-                sql = f"""
-                    INSERT INTO sec_officer (sec_form_d_id, first_name, last_name, title, street, city, state, zip_code)
-                    VALUES {values_sql}
-                """
-                await prisma.execute_raw(sql, *params)
-
-            await prisma.query_raw("COMMIT")
-            return len(form_d_ids)
-        except Exception:
-            await prisma.query_raw("ROLLBACK")
-            raise
+        items = list({item[1]: item for item in items}.values())
+        chunk_size = 1000
+        statements = [
+            _form_d_save_params(items[i : i + chunk_size])
+            for i in range(0, len(items), chunk_size)
+        ]
+
+        # A single statement is atomic on its own; only multi-chunk batches
+        # need an explicit transaction
+        if len(statements) == 1:
+            return len(await prisma.query_raw(_FORM_D_SAVE_SQL, *statements[0]))
+
+        saved = 0
+        async with prisma.tx(timeout=_BATCH_TX_TIMEOUT) as tx:
+            for params in statements:
+                saved += len(await tx.query_raw(_FORM_D_SAVE_SQL, *params))
+        return saved
     except PrismaError as e:
         logger.error(f"Database error batch saving {len(items)} Form D records: {e}")
         return 0
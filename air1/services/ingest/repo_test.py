@@ -1,7 +1,6 @@
 import pytest
 import uuid
 from datetime import date
-from decimal import Decimal
 
 from air1.db.prisma_client import connect_db, disconnect_db
 from air1.services.ingest.models import (
@@ -17,10 +16,12 @@ from air1.services.ingest.repo import (
     enrich_company,
     get_companies_not_enriched,
     get_form_d_filings_not_parsed,
+    has_companies,
     save_form_d_complete,
     upsert_company,
     upsert_companies_batch,
     upsert_filing,
+    upsert_filings_batch,
 )
 
 
@@ -67,6 +68,9 @@ async def test_upsert_companies_batch():
     count = await upsert_companies_batch(companies)
     assert count == 3
 
+    # Unchanged rows are not rewritten but still count as stored
+    assert await upsert_companies_batch(companies) == 3
+
 
 @pytest.mark.asyncio
 @pytest.mark.unit
@@ -123,6 +127,14 @@ async def test_count_companies():
     assert not_enriched >= 1
 
 
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_has_companies():
+    await upsert_company(SecCompanyData(cik=f"C{_uid()}", name="Existing"))
+
+    assert await has_companies() is True
+
+
 # ── sec_filing ───────────────────────────────────────────────────────────────
 
 
@@ -150,6 +162,25 @@ async def test_upsert_filing():
     assert filing_id2 == filing_id
 
 
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_upsert_filings_batch():
+    prefix = _uid()
+    filings = [
+        SecFilingData(
+            accession_number=f"0002-{prefix}-{i}",
+            cik=f"F{prefix}",
+            form_type="D",
+            filing_date=date(2025, 6, 1),
+        )
+        for i in range(3)
+    ]
+    assert await upsert_filings_batch(filings[:2]) == 2
+
+    # Two existing rows are updated, one new row inserted
+    assert await upsert_filings_batch(filings) == 3
+
+
 @pytest.mark.asyncio
 @pytest.mark.unit
 async def test_get_form_d_filings_not_parsed():
@@ -201,9 +232,9 @@ async def test_save_form_d_complete():
         entity_type="Corporation",
         industry_group_type="Technology",
         revenue_range="$1-$5M",
-        total_offering_amount=Decimal("5000000"),
-        total_amount_sold=Decimal("2000000"),
-        total_remaining=Decimal("3000000"),
+        total_offering_amount=500_000_000,
+        total_amount_sold=200_000_000,
+        total_remaining=300_000_000,
         officers=[
             SecOfficerData(first_name="Alice", last_name="CEO", title="Chief Executive Officer"),
             SecOfficerData(first_name="Bob", last_name="CTO", title="Chief Technology Officer"),
@@ -253,7 +284,7 @@ async def test_save_form_d_upsert_idempotent():
 
     form_d = SecFormDData(
         accession_number=acc, cik=cik, filing_date=date(2025, 6, 1),
-        issuer_name="Idempotent Co", total_offering_amount=Decimal("1000000"),
+        issuer_name="Idempotent Co", total_offering_amount=100_000_000,
     )
     ok1, id1 = await save_form_d_complete(form_d, sec_filing_id=filing_id)
     ok2, id2 = await save_form_d_complete(form_d, sec_filing_id=filing_id)
@@ -1,14 +1,20 @@
 """SEC EDGAR API client using edgartools library.
 
 edgartools is synchronous, so all calls are wrapped with asyncio.to_thread()
-to integrate with the async codebase. The library handles rate limiting,
-caching, and retries internally.
+to integrate with the async codebase. Each fetch does its blocking calls and
+DataFrame/XML conversion in a single to_thread hop, keeping CPU-bound parsing
+off the event loop. The library handles rate limiting, caching, and retries
+internally over its own shared HTTP client; a semaphore here caps how many
+calls are in flight so concurrent batches don't park dozens of worker
+threads on that rate limiter.
 """
 
 import asyncio
-import math
+import contextvars
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, timedelta
-from decimal import Decimal, InvalidOperation
+from decimal import ROUND_HALF_UP, Decimal, InvalidOperation
 from typing import Optional
 
 from loguru import logger
@@ -23,40 +29,96 @@ from air1.services.ingest.models import (
 )
 
 
+def _to_cents(val) -> Optional[int]:
+    """USD amount -> whole cents; ints and Decimals skip the string round-trip."""
+    if val is None:
+        return None
+    if isinstance(val, int) and not isinstance(val, bool):
+        return val * 100
+    try:
+        amount = val if isinstance(val, Decimal) else Decimal(str(val))
+        return int((amount * 100).to_integral_value(ROUND_HALF_UP))
+    except (InvalidOperation, ValueError, OverflowError):
+        return None
+
+
+def _to_int(val) -> Optional[int]:
+    if val is None:
+        return None
+    try:
+        return int(str(val))
+    except (ValueError, TypeError):
+        return None
+
+
+_TRUE = frozenset({"true", "yes", "y", "1"})
+_FALSE = frozenset({"false", "no", "n", "0"})
+
+
+def _to_bool(val) -> Optional[bool]:
+    if val is None:
+        return None
+    if isinstance(val, bool):
+        return val
+    s = str(val).lower()
+    if s in _TRUE:
+        return True
+    if s in _FALSE:
+        return False
+    return None
+
+
 class SECClient:
     """Async wrapper around the edgartools library."""
 
-    def __init__(self, identity: str):
+    def __init__(self, identity: str, max_concurrency: int = 10):
         from edgar import set_identity
 
         set_identity(identity)
+        # SEC allows ~10 req/s; more in-flight calls only queue inside edgartools
+        self._sem = asyncio.Semaphore(max_concurrency)
+        # Own worker threads, so SEC fetches parked on edgartools' rate
+        # limiter never occupy the loop's default executor
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="sec-edgar"
+        )
         logger.info(f"SEC EDGAR client initialized with identity: {identity}")
 
+    def close(self) -> None:
+        """Release the worker threads; calls still queued are cancelled."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _to_thread(self, func, *args):
+        """Run a blocking edgartools call in a worker thread, bounded by the semaphore."""
+        ctx = contextvars.copy_context()
+        async with self._sem:
+            return await asyncio.get_running_loop().run_in_executor(
+                self._executor, functools.partial(ctx.run, func, *args)
+            )
+
     async def fetch_company_tickers(self) -> list[SecCompanyData]:
         """Download the full list of ~10K public companies."""
         from edgar import get_company_tickers
 
         logger.info("Fetching company tickers from SEC EDGAR...")
-        df = await asyncio.to_thread(get_company_tickers)
-
-        def _clean(val):
-            """Convert pandas NaN/None to None."""
-            if val is None:
-                return None
-            if isinstance(val, float) and math.isnan(val):
-                return None
-            return str(val)
-
-        companies = []
-        for row in df.itertuples():
-            companies.append(
-                SecCompanyData(
-                    cik=str(row.cik),
-                    name=row.company,
-                    ticker=_clean(row.ticker) if hasattr(row, "ticker") else None,
-                    exchange=_clean(row.exchange) if hasattr(row, "exchange") else None,
-                )
+
+        def _fetch() -> list[SecCompanyData]:
+            # Convert inside the worker thread so the DataFrame is dropped
+            # before returning and never sits on the event loop. Cleaning is
+            # done column-wise: missing columns come back from reindex as
+            # all-NaN, and every NaN becomes None in one pass.
+            df = get_company_tickers().reindex(
+                columns=["cik", "company", "ticker", "exchange"]
             )
+            df["cik"] = df["cik"].astype(str)
+            df[["ticker", "exchange"]] = df[["ticker", "exchange"]].astype("string")
+            df = df.astype(object).where(df.notna(), None)
+            return [
+                SecCompanyData(cik=cik, name=name, ticker=ticker, exchange=exchange)
+                for cik, name, ticker, exchange in df.itertuples(index=False, name=None)
+            ]
+
+        companies = await self._to_thread(_fetch)
         logger.info(f"Fetched {len(companies)} company tickers")
         return companies
 
@@ -65,7 +127,7 @@ class SECClient:
         from edgar import Company
 
         try:
-            company = await asyncio.to_thread(Company, cik)
+            company = await self._to_thread(Company, cik)
             data = company.data
             addr = data.business_address
 
@@ -99,10 +161,11 @@ class SECClient:
 
         try:
             logger.info(f"Fetching Form D filings from {date_start} to {date_end}...")
-            filings = await asyncio.to_thread(
-                get_filings, form="D", filing_date=f"{date_start}:{date_end}"
+            return await self._to_thread(
+                lambda: self._filings_to_list(
+                    get_filings(form="D", filing_date=f"{date_start}:{date_end}")
+                )
             )
-            return self._filings_to_list(filings)
         except Exception as e:
             raise SECAPIError(f"Failed to fetch Form D filings: {e}") from e
 
@@ -119,10 +182,11 @@ class SECClient:
 
         try:
             logger.info(f"Fetching daily Form D index for {date_str}...")
-            table = await asyncio.to_thread(fetch_daily_filing_index, date_str)
-            filings = Filings(table)
-            form_d = filings.filter(form="D")
-            return self._filings_to_list(form_d)
+            return await self._to_thread(
+                lambda: self._filings_to_list(
+                    Filings(fetch_daily_filing_index(date_str)).filter(form="D")
+                )
+            )
         except Exception as e:
             raise SECAPIError(f"Failed to fetch daily Form D filings for {date_str}: {e}") from e
 
@@ -132,10 +196,11 @@ class SECClient:
 
         try:
             logger.info("Fetching current Form D filings from SEC feed...")
-            filings = await asyncio.to_thread(
-                get_current_filings, form="D", page_size=None
+            return await self._to_thread(
+                lambda: self._filings_to_list(
+                    get_current_filings(form="D", page_size=None)
+                )
             )
-            return self._filings_to_list(filings)
         except Exception as e:
             raise SECAPIError(f"Failed to fetch current Form D filings: {e}") from e
 
@@ -145,18 +210,36 @@ class SECClient:
             logger.info("No Form D filings found")
             return []
 
-        df = filings.to_pandas()
-        results = []
-        for row in df.itertuples():
-            results.append(
-                SecFilingData(
-                    accession_number=row.accession_number,
-                    cik=str(row.cik),
-                    form_type=row.form,
-                    filing_date=row.filing_date if isinstance(row.filing_date, date) else date.fromisoformat(str(row.filing_date)),
-                    company_name=row.company if hasattr(row, "company") else None,
-                )
+        import pyarrow as pa
+
+        # Read the index's Arrow columns directly instead of building a
+        # DataFrame just to tear it back down into models
+        table = filings.data
+
+        def _column(name: str, as_type=None) -> list:
+            if name not in table.column_names:
+                return [None] * table.num_rows
+            col = table.column(name)
+            if as_type is not None and col.type != as_type:
+                col = col.cast(as_type)
+            return col.to_pylist()
+
+        results = [
+            SecFilingData(
+                accession_number=accession_number,
+                cik=cik,
+                form_type=form,
+                filing_date=filing_date,
+                company_name=company,
             )
+            for accession_number, cik, form, filing_date, company in zip(
+                _column("accession_number"),
+                _column("cik", pa.string()),
+                _column("form"),
+                _column("filing_date", pa.date32()),
+                _column("company"),
+            )
+        ]
         logger.info(f"Fetched {len(results)} Form D filings")
         return results
 
@@ -166,13 +249,14 @@ class SECClient:
         """Fetch and parse a single Form D filing's details."""
         from edgar import get_by_accession_number
 
-        try:
-            filing = await asyncio.to_thread(
-                get_by_accession_number, accession_number
+        def _fetch() -> SecFormDData:
+            filing = get_by_accession_number(accession_number)
+            return self._parse_form_d(
+                filing.obj(), accession_number, str(filing.cik), filing.filing_date
             )
-            form_d = await asyncio.to_thread(filing.obj)
 
-            return self._parse_form_d(form_d, accession_number, str(filing.cik), filing.filing_date)
+        try:
+            return await self._to_thread(_fetch)
         except FormDParsingError:
             raise
         except Exception as e:
@@ -185,55 +269,26 @@ class SECClient:
         """Extract structured data from an edgartools FormD object."""
         issuer = form_d.primary_issuer
         offering = form_d.offering_data
-
-        def _to_decimal(val) -> Optional[Decimal]:
-            if val is None:
-                return None
-            try:
-                return Decimal(str(val))
-            except (InvalidOperation, ValueError):
-                return None
-
-        def _to_int(val) -> Optional[int]:
-            if val is None:
-                return None
-            try:
-                return int(str(val))
-            except (ValueError, TypeError):
-                return None
-
-        def _to_bool(val) -> Optional[bool]:
-            if val is None:
-                return None
-            if isinstance(val, bool):
-                return val
-            s = str(val).lower()
-            if s in ("true", "yes", "y", "1"):
-                return True
-            if s in ("false", "no", "n", "0"):
-                return False
-            return None
+        issuer_addr = getattr(issuer, "primary_address", None)
 
         # Extract offering sales amounts
         offering_amount = None
         amount_sold = None
         remaining = None
-        if offering and hasattr(offering, "offering_sales_amounts"):
-            osa = offering.offering_sales_amounts
-            if osa:
-                offering_amount = _to_decimal(getattr(osa, "total_offering_amount", None))
-                amount_sold = _to_decimal(getattr(osa, "total_amount_sold", None))
-                remaining = _to_decimal(getattr(osa, "total_remaining", None))
+        osa = getattr(offering, "offering_sales_amounts", None)
+        if osa:
+            offering_amount = _to_cents(getattr(osa, "total_offering_amount", None))
+            amount_sold = _to_cents(getattr(osa, "total_amount_sold", None))
+            remaining = _to_cents(getattr(osa, "total_remaining", None))
 
         # Parse date of first sale
         date_of_first_sale = None
-        if offering and hasattr(offering, "date_of_first_sale"):
-            raw_date = offering.date_of_first_sale
-            if raw_date and raw_date != "Yet to occur":
-                try:
-                    date_of_first_sale = date.fromisoformat(str(raw_date))
-                except (ValueError, TypeError):
-                    pass
+        raw_date = getattr(offering, "date_of_first_sale", None)
+        if raw_date and raw_date != "Yet to occur":
+            try:
+                date_of_first_sale = date.fromisoformat(str(raw_date))
+            except (ValueError, TypeError):
+                pass
 
         # Extract additional offering fields
         minimum_investment = None
@@ -249,7 +304,7 @@ class SECClient:
         gross_proceeds_used = None
 
         if offering:
-            minimum_investment = _to_decimal(getattr(offering, "minimum_investment", None))
+            minimum_investment = _to_cents(getattr(offering, "minimum_investment", None))
             is_equity = _to_bool(getattr(offering, "is_equity", None))
             is_pooled_investment = _to_bool(getattr(offering, "is_pooled_investment", None))
             # edgartools `is_new` is actually `isAmendment` (True = amendment, not new)
@@ -275,13 +330,13 @@ class SECClient:
             # Sales commission and finder's fees
             scff = getattr(offering, "sales_commission_finders_fees", None)
             if scff:
-                sales_commission = _to_decimal(getattr(scff, "sales_commission", None))
-                finders_fees = _to_decimal(getattr(scff, "finders_fees", None))
+                sales_commission = _to_cents(getattr(scff, "sales_commission", None))
+                finders_fees = _to_cents(getattr(scff, "finders_fees", None))
 
             # Use of proceeds
             uop = getattr(offering, "use_of_proceeds", None)
             if uop:
-                gross_proceeds_used = _to_decimal(getattr(uop, "gross_proceeds_used", None))
+                gross_proceeds_used = _to_cents(getattr(uop, "gross_proceeds_used", None))
 
         # Build title lookup from signature block
         title_map: dict[str, str] = {}
@@ -307,7 +362,7 @@ class SECClient:
 
             # Try to find title from signature block (full name only to avoid mismatches)
             person_title = None
-            if first and last:
+            if title_map and first and last:
                 full_name = f"{first} {last}".strip().lower()
                 person_title = title_map.get(full_name)
 
@@ -316,26 +371,25 @@ class SECClient:
                     first_name=first,
                     last_name=last,
                     title=person_title,
-                    street=addr.street1 if addr and hasattr(addr, "street1") else None,
-                    city=addr.city if addr and hasattr(addr, "city") else None,
-                    state=addr.state_or_country if addr and hasattr(addr, "state_or_country") else None,
-                    zip_code=addr.zipcode if addr and hasattr(addr, "zipcode") else None,
+                    street=getattr(addr, "street1", None),
+                    city=getattr(addr, "city", None),
+                    state=getattr(addr, "state_or_country", None),
+                    zip_code=getattr(addr, "zipcode", None),
                 )
             )
 
         # Parse federal exemptions
         federal_exemptions = None
-        if offering and hasattr(offering, "federal_exemptions"):
-            exemptions = offering.federal_exemptions
-            if exemptions:
-                federal_exemptions = ",".join(str(e) for e in exemptions)
+        exemptions = getattr(offering, "federal_exemptions", None)
+        if exemptions:
+            federal_exemptions = ",".join(str(e) for e in exemptions)
 
         # Parse industry group
         industry_group_type = None
-        if offering and hasattr(offering, "industry_group"):
-            ig = offering.industry_group
-            if ig and hasattr(ig, "industry_group_type"):
-                industry_group_type = str(ig.industry_group_type)
+        ig = getattr(offering, "industry_group", None)
+        ig_type = getattr(ig, "industry_group_type", None)
+        if ig_type is not None:
+            industry_group_type = str(ig_type)
 
         filing_date_parsed = filing_date if isinstance(filing_date, date) else date.fromisoformat(str(filing_date))
 
@@ -343,15 +397,15 @@ class SECClient:
             accession_number=accession_number,
             cik=cik,
             filing_date=filing_date_parsed,
-            issuer_name=getattr(issuer, "entity_name", None) if issuer else None,
-            issuer_street=getattr(issuer.primary_address, "street1", None) if issuer and getattr(issuer, "primary_address", None) else None,
-            issuer_city=getattr(issuer.primary_address, "city", None) if issuer and getattr(issuer, "primary_address", None) else None,
-            issuer_state=getattr(issuer, "jurisdiction", None) if issuer else None,
-            issuer_zip=getattr(issuer.primary_address, "zipcode", None) if issuer and getattr(issuer, "primary_address", None) else None,
-            issuer_phone=getattr(issuer, "phone_number", None) if issuer else None,
-            entity_type=getattr(issuer, "entity_type", None) if issuer else None,
+            issuer_name=getattr(issuer, "entity_name", None),
+            issuer_street=getattr(issuer_addr, "street1", None),
+            issuer_city=getattr(issuer_addr, "city", None),
+            issuer_state=getattr(issuer, "jurisdiction", None),
+            issuer_zip=getattr(issuer_addr, "zipcode", None),
+            issuer_phone=getattr(issuer, "phone_number", None),
+            entity_type=getattr(issuer, "entity_type", None),
             industry_group_type=industry_group_type,
-            revenue_range=getattr(offering, "revenue_range", None) if offering else None,
+            revenue_range=getattr(offering, "revenue_range", None),
             federal_exemptions=federal_exemptions,
             total_offering_amount=offering_amount,
             total_amount_sold=amount_sold,
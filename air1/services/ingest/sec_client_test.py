@@ -1,67 +1,68 @@
+import asyncio
+import threading
+import time
+
 import pytest
 from datetime import date
-from decimal import Decimal
-from unittest.mock import MagicMock
+from types import SimpleNamespace
 
 from air1.services.ingest.sec_client import SECClient
 from air1.services.ingest.models import SecFormDData
 
 
 def _make_address(**kwargs):
-    addr = MagicMock()
-    addr.street1 = kwargs.get("street1")
-    addr.city = kwargs.get("city")
-    addr.state_or_country = kwargs.get("state_or_country")
-    addr.zipcode = kwargs.get("zipcode")
-    return addr
+    return SimpleNamespace(
+        street1=kwargs.get("street1"),
+        city=kwargs.get("city"),
+        state_or_country=kwargs.get("state_or_country"),
+        zipcode=kwargs.get("zipcode"),
+    )
 
 
 def _make_issuer(**kwargs):
-    issuer = MagicMock()
-    issuer.entity_name = kwargs.get("entity_name", "Test Corp")
-    issuer.jurisdiction = kwargs.get("jurisdiction", "DE")
-    issuer.entity_type = kwargs.get("entity_type", "Corporation")
-    issuer.phone_number = kwargs.get("phone_number", "555-0100")
-    issuer.primary_address = kwargs.get("primary_address", _make_address(
-        street1="123 Main St", city="Wilmington", state_or_country="DE", zipcode="19801"
-    ))
-    return issuer
+    return SimpleNamespace(
+        entity_name=kwargs.get("entity_name", "Test Corp"),
+        jurisdiction=kwargs.get("jurisdiction", "DE"),
+        entity_type=kwargs.get("entity_type", "Corporation"),
+        phone_number=kwargs.get("phone_number", "555-0100"),
+        primary_address=kwargs.get("primary_address", _make_address(
+            street1="123 Main St", city="Wilmington", state_or_country="DE", zipcode="19801"
+        )),
+    )
 
 
 def _make_offering(**kwargs):
-    offering = MagicMock()
-    osa = MagicMock()
-    osa.total_offering_amount = kwargs.get("total_offering_amount", 1000000)
-    osa.total_amount_sold = kwargs.get("total_amount_sold", 500000)
-    osa.total_remaining = kwargs.get("total_remaining", 500000)
-    offering.offering_sales_amounts = osa
-    offering.date_of_first_sale = kwargs.get("date_of_first_sale", "2025-01-15")
-    offering.revenue_range = kwargs.get("revenue_range", "$1-$5M")
-
-    ig = MagicMock()
-    ig.industry_group_type = kwargs.get("industry_group_type", "Technology")
-    offering.industry_group = ig
-
-    offering.federal_exemptions = kwargs.get("federal_exemptions", ["06b", "3C.1"])
-    return offering
+    return SimpleNamespace(
+        offering_sales_amounts=SimpleNamespace(
+            total_offering_amount=kwargs.get("total_offering_amount", 1000000),
+            total_amount_sold=kwargs.get("total_amount_sold", 500000),
+            total_remaining=kwargs.get("total_remaining", 500000),
+        ),
+        date_of_first_sale=kwargs.get("date_of_first_sale", "2025-01-15"),
+        revenue_range=kwargs.get("revenue_range", "$1-$5M"),
+        industry_group=SimpleNamespace(
+            industry_group_type=kwargs.get("industry_group_type", "Technology")
+        ),
+        federal_exemptions=kwargs.get("federal_exemptions", ["06b", "3C.1"]),
+    )
 
 
 def _make_person(first_name="Jane", last_name="Smith", address=None):
-    person = MagicMock()
-    person.first_name = first_name
-    person.last_name = last_name
-    person.address = address or _make_address(
-        street1="456 Oak Ave", city="SF", state_or_country="CA", zipcode="94102"
+    return SimpleNamespace(
+        first_name=first_name,
+        last_name=last_name,
+        address=address or _make_address(
+            street1="456 Oak Ave", city="SF", state_or_country="CA", zipcode="94102"
+        ),
     )
-    return person
 
 
 def _make_form_d(issuer=None, offering=None, persons=None):
-    form_d = MagicMock()
-    form_d.primary_issuer = issuer
-    form_d.offering_data = offering
-    form_d.related_persons = persons or []
-    return form_d
+    return SimpleNamespace(
+        primary_issuer=issuer,
+        offering_data=offering,
+        related_persons=persons or [],
+    )
 
 
 @pytest.mark.unit
@@ -88,9 +89,9 @@ class TestParseFormD:
         assert result.industry_group_type == "Technology"
         assert result.revenue_range == "$1-$5M"
         assert result.federal_exemptions == "06b,3C.1"
-        assert result.total_offering_amount == Decimal("1000000")
-        assert result.total_amount_sold == Decimal("500000")
-        assert result.total_remaining == Decimal("500000")
+        assert result.total_offering_amount == 100_000_000  # cents
+        assert result.total_amount_sold == 50_000_000
+        assert result.total_remaining == 50_000_000
         assert result.date_of_first_sale == date(2025, 1, 15)
         assert len(result.officers) == 2
         assert result.officers[0].first_name == "Jane"
@@ -157,6 +158,14 @@ class TestParseFormD:
         assert result.total_amount_sold is None
         assert result.total_remaining is None
 
+    def test_fractional_amounts_round_to_cents(self):
+        offering = _make_offering(total_offering_amount="1234.565", total_amount_sold=0.1)
+        form_d = _make_form_d(issuer=_make_issuer(), offering=offering)
+        result = SECClient._parse_form_d(form_d, "acc-015", "99", date(2025, 3, 1))
+
+        assert result.total_offering_amount == 123457
+        assert result.total_amount_sold == 10
+
     def test_filing_date_as_string(self):
         form_d = _make_form_d(issuer=_make_issuer(), offering=_make_offering())
         result = SECClient._parse_form_d(form_d, "acc-009", "99", "2025-06-15")
@@ -203,6 +212,20 @@ class TestParseFormD:
 
         assert result.federal_exemptions is None
 
+    def test_officer_title_from_signature_block(self):
+        form_d = _make_form_d(
+            issuer=_make_issuer(),
+            offering=_make_offering(),
+            persons=[_make_person(), _make_person(first_name="Bob", last_name="Jones")],
+        )
+        form_d.signature_block = SimpleNamespace(signatures=[
+            SimpleNamespace(title="CEO", name_of_signer=" Jane Smith ", signature_name=None),
+        ])
+        result = SECClient._parse_form_d(form_d, "acc-016", "99", date(2025, 3, 1))
+
+        assert result.officers[0].title == "CEO"
+        assert result.officers[1].title is None
+
     def test_no_industry_group(self):
         offering = _make_offering()
         offering.industry_group = None
@@ -210,3 +233,110 @@ class TestParseFormD:
         result = SECClient._parse_form_d(form_d, "acc-014", "99", date(2025, 3, 1))
 
         assert result.industry_group_type is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_to_thread_bounds_concurrent_calls():
+    client = SECClient(identity="Test test@test.com", max_concurrency=2)
+    lock = threading.Lock()
+    active = 0
+    peak = 0
+
+    def _blocking():
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.02)
+        with lock:
+            active -= 1
+
+    await asyncio.gather(*[client._to_thread(_blocking) for _ in range(6)])
+
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_fetch_company_tickers_cleans_missing_values(monkeypatch):
+    import edgar
+    import pandas as pd
+
+    df = pd.DataFrame(
+        {
+            "cik": [320193, 1234],
+            "company": ["Apple Inc.", "Acme Corp"],
+            "ticker": ["AAPL", float("nan")],
+            "exchange": ["Nasdaq", None],
+        }
+    )
+    monkeypatch.setattr(edgar, "get_company_tickers", lambda: df)
+
+    companies = await SECClient(identity="Test test@test.com").fetch_company_tickers()
+
+    assert [c.cik for c in companies] == ["320193", "1234"]
+    assert companies[0].ticker == "AAPL"
+    assert companies[1].ticker is None
+    assert companies[1].exchange is None
+
+
+@pytest.mark.unit
+def test_filings_to_list_converts_dates_and_missing_company():
+    import pyarrow as pa
+    from edgar._filings import Filings
+
+    filings = Filings(
+        pa.table(
+            {
+                "accession_number": ["acc-1", "acc-2"],
+                "cik": pa.array([1234, 5678], type=pa.int32()),
+                "form": ["D", "D/A"],
+                "filing_date": ["2025-03-01", "2025-03-02"],
+                "company": ["Acme Corp", None],
+            }
+        )
+    )
+
+    results = SECClient(identity="Test test@test.com")._filings_to_list(filings)
+
+    assert [r.cik for r in results] == ["1234", "5678"]
+    assert [r.filing_date for r in results] == [date(2025, 3, 1), date(2025, 3, 2)]
+    assert results[1].form_type == "D/A"
+    assert results[1].company_name is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_to_thread_runs_on_client_executor():
+    client = SECClient(identity="Test test@test.com")
+    try:
+        name = await client._to_thread(lambda: threading.current_thread().name)
+    finally:
+        client.close()
+
+    assert name.startswith("sec-edgar")
+
+
+@pytest.mark.unit
+def test_to_cents_accepts_int_decimal_and_text():
+    from decimal import Decimal
+
+    from air1.services.ingest.sec_client import _to_cents
+
+    assert _to_cents(5) == 500
+    assert _to_cents(Decimal("12.345")) == 1235
+    assert _to_cents("0.10") == 10
+    assert _to_cents(True) is None
+    assert _to_cents("n/a") is None
+
+
+@pytest.mark.unit
+def test_to_bool_parses_flag_strings():
+    from air1.services.ingest.sec_client import _to_bool
+
+    assert _to_bool("TRUE") is True
+    assert _to_bool("n") is False
+    assert _to_bool(False) is False
+    assert _to_bool("maybe") is None
+    assert _to_bool(None) is None
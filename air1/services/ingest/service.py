@@ -11,7 +11,9 @@ from typing import Optional
 
 from loguru import logger
 
+from air1.config import settings
 from air1.services.ingest import repo
+from air1.services.ingest.eager import gather_eager
 from air1.services.ingest.sec_client import SECClient
 
 
@@ -24,7 +26,9 @@ class IService(ABC):
         ...
 
     @abstractmethod
-    async def enrich_companies(self, batch_size: int = 500) -> int:
+    async def enrich_companies(
+        self, batch_size: int = 500, shard: int = 0, shards: int = 1
+    ) -> int:
         """Fetch SEC profiles for unenriched companies in one batch."""
         ...
 
@@ -38,6 +42,16 @@ class IService(ABC):
         """Fetch Form D filing index for a date range and store."""
         ...
 
+    @abstractmethod
+    async def ingest_and_parse_form_d(
+        self,
+        date_start: str | None = None,
+        date_end: str | None = None,
+        days: int = 30,
+    ) -> tuple[int, int]:
+        """Index Form D filings for a date range, parsing each chunk as it lands."""
+        ...
+
     @abstractmethod
     async def ingest_daily_form_d(self, date_str: Optional[str] = None) -> int:
         """Ingest Form D filings for a single day using the daily index."""
@@ -49,7 +63,9 @@ class IService(ABC):
         ...
 
     @abstractmethod
-    async def parse_form_d_details(self, batch_size: int = 100) -> int:
+    async def parse_form_d_details(
+        self, batch_size: int = 100, shard: int = 0, shards: int = 1
+    ) -> int:
         """Parse unparsed Form D filings to extract issuer, offering, and officers."""
         ...
 
@@ -71,6 +87,8 @@ class Service(IService):
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if self._client is not None:
+            self._client.close()
         self._client = None
 
     async def bootstrap_companies(self) -> int:
@@ -78,20 +96,33 @@ class Service(IService):
         logger.info("Bootstrapping SEC companies...")
         companies = await self._client.fetch_company_tickers()
         logger.info(f"Fetched {len(companies)} companies from SEC EDGAR")
-        count = await repo.upsert_companies_batch(companies)
+        # First load into an empty table has nothing to update on conflict.
+        # If the check fails, keep updating: skipping would silently drop
+        # ticker and name changes on a populated table.
+        update_existing = await repo.has_companies() is not False
+        count = await repo.upsert_companies_batch(
+            companies, update_existing=update_existing
+        )
         logger.info(f"Upserted {count}/{len(companies)} companies")
         return count
 
     async def enrich_companies(
-        self, batch_size: int = 500, concurrency: int = 8
+        self,
+        batch_size: int = 500,
+        concurrency: int = 8,
+        shard: int = 0,
+        shards: int = 1,
     ) -> int:
         """Fetch SEC profiles for unenriched companies.
 
         Processes one batch with concurrent requests (default 8, under
-        SEC's 10 req/s limit). Call repeatedly to enrich all.
+        SEC's 10 req/s limit). Call repeatedly to enrich all; batches on
+        different `shard`s (of `shards`) are disjoint and can run in parallel.
         Returns count of successfully enriched companies.
         """
-        unenriched = await repo.get_companies_not_enriched(limit=batch_size)
+        unenriched = await repo.get_companies_not_enriched(
+            limit=batch_size, shard=shard, shards=shards
+        )
         if not unenriched:
             logger.info("No unenriched companies remaining")
             return 0
@@ -107,7 +138,7 @@ class Service(IService):
                     logger.warning(f"Failed to enrich CIK={row['cik']}: {e}")
                     return None
 
-        results = await asyncio.gather(*[_fetch_one(r) for r in unenriched])
+        results = await gather_eager(*[_fetch_one(r) for r in unenriched])
         profiles = [p for p in results if p is not None]
         enriched = await repo.enrich_companies_batch(profiles)
         logger.info(f"Enriched {enriched}/{len(unenriched)} companies")
@@ -136,6 +167,51 @@ class Service(IService):
         filings = await self._client.fetch_form_d_filings(date_start, date_end)
         return await self._store_filings(filings)
 
+    async def ingest_and_parse_form_d(
+        self,
+        date_start: str | None = None,
+        date_end: str | None = None,
+        days: int = 30,
+        parse_workers: int = 2,
+        parse_batch: int = 100,
+    ) -> tuple[int, int]:
+        """Index Form D filings for a date range and parse them as they are stored.
+
+        The index write and the parse run as a producer/consumer pipeline:
+        each stored chunk's accession numbers go onto a bounded queue and
+        `parse_workers` consumers parse them in `parse_batch`-sized slices,
+        so parsing starts with the first chunk instead of after the last.
+
+        Returns (filings stored, filings parsed).
+        """
+        if date_end is None:
+            date_end = date.today().isoformat()
+        if date_start is None:
+            date_start = (date.today() - timedelta(days=days)).isoformat()
+
+        filings = await self._client.fetch_form_d_filings(date_start, date_end)
+        queue: asyncio.Queue[list[str] | None] = asyncio.Queue(maxsize=parse_workers)
+
+        async def _produce() -> int:
+            stored = await self._store_filings(filings, queue=queue)
+            for _ in range(parse_workers):
+                await queue.put(None)
+            return stored
+
+        async def _consume() -> int:
+            parsed = 0
+            while (accessions := await queue.get()) is not None:
+                rows = await repo.get_form_d_filings_not_parsed_by_accession(accessions)
+                for i in range(0, len(rows), parse_batch):
+                    parsed += await self._parse_rows(rows[i : i + parse_batch])
+            return parsed
+
+        async with asyncio.TaskGroup() as tg:
+            stored = tg.create_task(_produce())
+            consumers = [tg.create_task(_consume()) for _ in range(parse_workers)]
+
+        return stored.result(), sum(c.result() for c in consumers)
+
     async def ingest_daily_form_d(self, date_str: Optional[str] = None) -> int:
         """Ingest Form D filings for a single day using the daily index (efficient).
 
@@ -150,35 +226,70 @@ class Service(IService):
         filings = await self._client.fetch_current_form_d_filings()
         return await self._store_filings(filings)
 
-    async def _store_filings(self, filings: list) -> int:
-        """Store a list of SecFilingData in batch (single SQL query per chunk)."""
+    async def _store_filings(
+        self, filings: list, queue: asyncio.Queue | None = None
+    ) -> int:
+        """Store a list of SecFilingData in batch (single SQL query per chunk).
+
+        If `queue` is given, each stored chunk's accession numbers are put on
+        it for a downstream parser.
+        """
         if not filings:
             return 0
 
-        # Postgres has a parameter limit (~32K), chunk at 1000 filings (5 params each)
+        # Chunks keep each statement bounded and hand the parser work early;
+        # they are independent, so several are written at once
         chunk_size = 1000
-        stored = 0
-        for i in range(0, len(filings), chunk_size):
-            chunk = filings[i : i + chunk_size]
-            stored += await repo.upsert_filings_batch(chunk)
+        sem = asyncio.Semaphore(settings.database_write_concurrency)
+
+        async def _store_chunk(chunk: list) -> int:
+            async with sem:
+                count = await repo.upsert_filings_batch(chunk)
+            if queue is not None:
+                await queue.put([f.accession_number for f in chunk])
+            return count
+
+        stored = sum(
+            await gather_eager(
+                *(
+                    _store_chunk(filings[i : i + chunk_size])
+                    for i in range(0, len(filings), chunk_size)
+                )
+            )
+        )
         logger.info(f"Stored {stored}/{len(filings)} Form D filings")
         return stored
 
     async def parse_form_d_details(
-        self, batch_size: int = 100, concurrency: int = 8
+        self,
+        batch_size: int = 100,
+        concurrency: int = 8,
+        shard: int = 0,
+        shards: int = 1,
     ) -> int:
         """Parse unparsed Form D filings to extract issuer, offering, and officers.
 
         Fetches Form D XML from SEC concurrently (up to `concurrency`), then
-        writes to DB sequentially (transactions require serial access).
+        writes the batch in bulk: issuer companies as concurrent upsert chunks,
+        then every Form D and its officers as batched insert statements.
         Auto-creates sec_company records from issuer data for private companies.
+        Batches on different `shard`s (of `shards`) never pick the same filing,
+        so shards can run in parallel.
 
         Returns count of successfully parsed filings.
         """
-        unparsed = await repo.get_form_d_filings_not_parsed(limit=batch_size)
+        unparsed = await repo.get_form_d_filings_not_parsed(
+            limit=batch_size, shard=shard, shards=shards
+        )
         if not unparsed:
             logger.info("No unparsed Form D filings remaining")
             return 0
+        return await self._parse_rows(unparsed, concurrency)
+
+    async def _parse_rows(self, unparsed: list[dict], concurrency: int = 8) -> int:
+        """Fetch, parse and store the given unparsed sec_filing rows."""
+        if not unparsed:
+            return 0
 
         logger.info(f"Parsing {len(unparsed)} Form D filings ({concurrency} concurrent fetches)...")
 
@@ -198,7 +309,7 @@ class Service(IService):
                     )
                     return (row, None)
 
-        fetch_results = await asyncio.gather(*[_fetch_one(r) for r in unparsed])
+        fetch_results = await gather_eager(*[_fetch_one(r) for r in unparsed])
 
         # Step 2: Collect valid results and batch-write to DB
         issuers: dict[str, tuple] = {}
@@ -225,8 +336,8 @@ class Service(IService):
         # Batch save all form_d + officers in a single transaction
         parsed = await repo.save_form_d_batch(form_d_items)
 
-        # Link any filings that were orphaned before the company was created
-        await repo.link_orphaned_filings()
+        # Link this batch's filings that were orphaned before the company existed
+        await repo.link_orphaned_filings(ciks=list({row["cik"] for row in unparsed}))
 
         logger.info(f"Parsed {parsed}/{len(unparsed)} Form D filings")
         return parsed
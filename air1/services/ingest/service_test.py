@@ -35,12 +35,47 @@ async def test_bootstrap_companies(service, mock_client):
     mock_client.fetch_company_tickers.return_value = companies
 
     with patch("air1.services.ingest.service.repo") as mock_repo:
+        mock_repo.has_companies = AsyncMock(return_value=True)
         mock_repo.upsert_companies_batch = AsyncMock(return_value=2)
         result = await service.bootstrap_companies()
 
     assert result == 2
     mock_client.fetch_company_tickers.assert_awaited_once()
-    mock_repo.upsert_companies_batch.assert_awaited_once_with(companies)
+    mock_repo.upsert_companies_batch.assert_awaited_once_with(
+        companies, update_existing=True
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_bootstrap_companies_first_load_skips_updates(service, mock_client):
+    companies = [SecCompanyData(cik="1234", name="Acme Corp")]
+    mock_client.fetch_company_tickers.return_value = companies
+
+    with patch("air1.services.ingest.service.repo") as mock_repo:
+        mock_repo.has_companies = AsyncMock(return_value=False)
+        mock_repo.upsert_companies_batch = AsyncMock(return_value=1)
+        await service.bootstrap_companies()
+
+    mock_repo.upsert_companies_batch.assert_awaited_once_with(
+        companies, update_existing=False
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_bootstrap_companies_keeps_updates_when_check_fails(service, mock_client):
+    companies = [SecCompanyData(cik="1234", name="Acme Corp")]
+    mock_client.fetch_company_tickers.return_value = companies
+
+    with patch("air1.services.ingest.service.repo") as mock_repo:
+        mock_repo.has_companies = AsyncMock(return_value=None)
+        mock_repo.upsert_companies_batch = AsyncMock(return_value=1)
+        await service.bootstrap_companies()
+
+    mock_repo.upsert_companies_batch.assert_awaited_once_with(
+        companies, update_existing=True
+    )
 
 
 @pytest.mark.asyncio
@@ -54,6 +89,7 @@ async def test_bootstrap_companies_partial_failures(service, mock_client):
     mock_client.fetch_company_tickers.return_value = companies
 
     with patch("air1.services.ingest.service.repo") as mock_repo:
+        mock_repo.has_companies = AsyncMock(return_value=True)
         mock_repo.upsert_companies_batch = AsyncMock(return_value=1)
         result = await service.bootstrap_companies()
 
@@ -171,6 +207,69 @@ async def test_ingest_form_d_empty_result(service, mock_client):
     assert result == 0
 
 
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_ingest_form_d_writes_every_chunk(service, mock_client):
+    filings = [
+        SecFilingData(
+            accession_number=f"0001-24-{i:05d}",
+            cik="1234",
+            form_type="D",
+            filing_date=date(2025, 1, 15),
+        )
+        for i in range(2500)
+    ]
+    mock_client.fetch_form_d_filings.return_value = filings
+
+    with patch("air1.services.ingest.service.repo") as mock_repo:
+        mock_repo.upsert_filings_batch = AsyncMock(
+            side_effect=lambda chunk: len(chunk)
+        )
+        result = await service.ingest_form_d_filings(
+            date_start="2025-01-01", date_end="2025-01-31"
+        )
+
+    assert result == 2500
+    sizes = sorted(len(c.args[0]) for c in mock_repo.upsert_filings_batch.await_args_list)
+    assert sizes == [500, 1000, 1000]
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_ingest_and_parse_form_d_streams_stored_chunks(service, mock_client):
+    filings = [
+        SecFilingData(
+            accession_number="0001-24-001",
+            cik="1234",
+            form_type="D",
+            filing_date=date(2025, 1, 15),
+        ),
+    ]
+    mock_client.fetch_form_d_filings.return_value = filings
+    mock_client.fetch_form_d_detail.return_value = SecFormDData(
+        accession_number="0001-24-001", cik="1234", filing_date=date(2025, 1, 15)
+    )
+    unparsed = [{"secFilingId": 1, "accessionNumber": "0001-24-001", "cik": "1234"}]
+
+    with patch("air1.services.ingest.service.repo") as mock_repo:
+        mock_repo.upsert_filings_batch = AsyncMock(return_value=1)
+        mock_repo.get_form_d_filings_not_parsed_by_accession = AsyncMock(
+            return_value=unparsed
+        )
+        mock_repo.upsert_companies_from_issuers_batch = AsyncMock(return_value=0)
+        mock_repo.save_form_d_batch = AsyncMock(return_value=1)
+        mock_repo.link_orphaned_filings = AsyncMock()
+        result = await service.ingest_and_parse_form_d(
+            date_start="2025-01-01", date_end="2025-01-31"
+        )
+
+    assert result == (1, 1)
+    mock_repo.get_form_d_filings_not_parsed_by_accession.assert_awaited_once_with(
+        ["0001-24-001"]
+    )
+    mock_client.fetch_form_d_detail.assert_awaited_once_with("0001-24-001")
+
+
 @pytest.mark.asyncio
 @pytest.mark.unit
 async def test_parse_form_d_details(service, mock_client):
@@ -206,7 +305,7 @@ async def test_parse_form_d_details(service, mock_client):
     items = mock_repo.save_form_d_batch.call_args[0][0]
     assert len(items) == 1
     assert items[0] == (form_d, 1)
-    mock_repo.link_orphaned_filings.assert_awaited_once()
+    mock_repo.link_orphaned_filings.assert_awaited_once_with(ciks=["1234"])
 
 
 @pytest.mark.asyncio
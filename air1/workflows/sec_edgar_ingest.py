@@ -25,21 +25,31 @@ from air1.services.ingest.flows import (
     full_ingest_flow,
 )
 
+try:
+    import uvloop
+except ImportError:  # not available on Windows
+    uvloop = None
+
+# The flows are pure I/O orchestration; uvloop cuts per-task loop overhead.
+# Only this entrypoint's own loop uses it, so importing the flows elsewhere
+# (Prefect workers, tests) leaves the global loop policy alone.
+run = uvloop.run if uvloop is not None else asyncio.run
+
 if __name__ == "__main__":
     command = sys.argv[1] if len(sys.argv) > 1 else "full"
 
     if command == "full":
-        result = asyncio.run(full_ingest_flow())
+        result = run(full_ingest_flow())
     elif command == "daily":
         date_str = sys.argv[2] if len(sys.argv) > 2 else None
-        result = asyncio.run(form_d_daily_flow(date_str=date_str))
+        result = run(form_d_daily_flow(date_str=date_str))
     elif command == "form-d":
         days = int(sys.argv[2]) if len(sys.argv) > 2 else 30
-        result = asyncio.run(form_d_flow(days=days))
+        result = run(form_d_flow(days=days))
     elif command == "bootstrap":
-        result = asyncio.run(bootstrap_flow())
+        result = run(bootstrap_flow())
     elif command == "enrich":
-        result = asyncio.run(enrich_flow())
+        result = run(enrich_flow())
     else:
         print("Usage: python air1/workflows/sec_edgar_ingest.py [full|daily|form-d|bootstrap|enrich]")
         sys.exit(1)